@@ -1,10 +1,31 @@
 # File: django_starter/__init__.py
 
-from .core.base_installer import BaseInstaller
-from .core.django_installer import DjangoInstaller
-from .core.tailwind_installer import TailwindInstaller
-from .core.unfold_installer import UnfoldInstaller
-from .templates.base_template_creator import BaseTemplateCreator
-from .templates.app_template_creator import AppTemplateCreator
+import importlib
 
 __version__ = "1.0.0"
+
+# Public classes and the modules defining them. They are imported on first
+# access, so `django-starter --help` doesn't load every installer.
+_LAZY_ATTRIBUTES = {
+    "BaseInstaller": ".core.base_installer",
+    "DjangoInstaller": ".core.django_installer",
+    "TailwindInstaller": ".core.tailwind_installer",
+    "UnfoldInstaller": ".core.unfold_installer",
+    "BaseTemplateCreator": ".templates.base_template_creator",
+    "AppTemplateCreator": ".templates.app_template_creator",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
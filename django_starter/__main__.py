@@ -1,55 +1,269 @@
+import argparse
 import sys
 from pathlib import Path
-from . import (
-    BaseInstaller,
-    DjangoInstaller,
-    TailwindInstaller,
-    UnfoldInstaller,
-    BaseTemplateCreator,
-    AppTemplateCreator,
+# Only what parse_args needs; each command imports the subsystems it runs,
+# so --help and argument errors return without loading the installers
+from .core.project_spec import (
+    CACHE_SCHEMES, DATABASES, SETTINGS_PROFILES, cache_scheme, load_project_specs
 )
+from .templates.template_generators.gunicorn_templates import WORKER_CLASSES
 
-def main():
+def get_installers():
+    """Import every installer class that declares REQUIREMENTS."""
+    from .core.cache_installer import CacheInstaller
+    from .core.django_installer import DjangoInstaller
+    from .core.gunicorn_config import GunicornConfig
+    from .core.settings_profile import ProductionSettings
+    from .core.tailwind_installer import TailwindInstaller
+    from .core.unfold_installer import UnfoldInstaller
+    from .core.whitenoise_installer import WhiteNoiseInstaller
+    from .utils.timezone_selector import TimezoneSelector
+
+    return (
+        DjangoInstaller,
+        TimezoneSelector,
+        TailwindInstaller,
+        UnfoldInstaller,
+        ProductionSettings,
+        GunicornConfig,
+        WhiteNoiseInstaller,
+        CacheInstaller,
+    )
+
+def parse_args(argv=None):
+    cache_options = argparse.ArgumentParser(add_help=False)
+    cache_options.add_argument(
+        "--wheelhouse",
+        type=lambda value: Path(value).resolve(),
+        help="Install Python packages only from this directory of wheels",
+    )
+    cache_options.add_argument(
+        "--npm-cache",
+        type=lambda value: Path(value).resolve(),
+        help="Install Tailwind's npm packages offline from this npm cache",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="django-starter",
+        description="Create a Django project with Tailwind CSS and Unfold admin.",
+        parents=[cache_options],
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=4,
+        help="Number of independent setup steps to run at once (1 runs them sequentially)",
+    )
+    parser.add_argument(
+        "--skeleton-cache",
+        type=lambda value: Path(value).resolve(),
+        help="Reuse the Tailwind theme and its node_modules cached here "
+             "(default: $XDG_CACHE_HOME or ~/.cache, under django-starter/skeletons)",
+    )
+    parser.add_argument(
+        "--no-skeleton-cache",
+        action="store_true",
+        help="Always run tailwind init and npm install from scratch",
+    )
+    parser.add_argument(
+        "--database",
+        choices=DATABASES,
+        default="sqlite",
+        help="Database backend; postgresql adds trigram indexes for admin search (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--settings-profile",
+        choices=SETTINGS_PROFILES,
+        default="development",
+        help="production splits settings into base/dev/prod, reading DATABASE_URL (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--worker-class",
+        choices=WORKER_CLASSES,
+        default="gthread",
+        help="Gunicorn worker class for the generated gunicorn.conf.py (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--cache-url",
+        default="locmem://",
+        help="Cache for pages and template fragments: locmem://, file:///path or redis://host:6379/0 (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--blueprints",
+        type=lambda value: Path(value).resolve(),
+        help="TOML file of app blueprints overriding or adding to the built-in ones",
+    )
+    parser.add_argument(
+        "--squash-migrations",
+        action="store_true",
+        help="With update and add-app, squash each app's migrations made since its last squash",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print a table of how long each setup step took",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the in-process steps with cProfile (implies --jobs 1)",
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        help="Create the project described by this TOML file without prompting",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser(
+        "prefetch",
+        parents=[cache_options],
+        help="Fill --wheelhouse and/or --npm-cache for later offline runs",
+    )
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Create every project listed in a TOML file across a process pool",
+    )
+    batch_parser.add_argument("file", type=Path, help="TOML file with [[projects]] tables")
+    batch_parser.add_argument(
+        "-p", "--processes",
+        type=int,
+        help="Number of projects to create at once (defaults to the CPU count)",
+    )
+    update_parser = subparsers.add_parser(
+        "update",
+        help="Regenerate a project in django_projects/, keeping files edited since",
+    )
+    update_parser.add_argument(
+        "project",
+        nargs="?",
+        help="Project to update (defaults to the project named by --config, "
+             "whose apps missing from the project are added)",
+    )
+    add_app_parser = subparsers.add_parser(
+        "add-app",
+        help="Add apps to an existing project without rebuilding it",
+    )
+    add_app_parser.add_argument("apps", nargs="+", metavar="NAME", help="Name of an app to add")
+    add_app_parser.add_argument(
+        "--project",
+        help="Project to add the apps to (defaults to the current directory "
+             "or the only project in django_projects/)",
+    )
+    return parser.parse_args(argv)
+
+def get_resolver(wheelhouse=None, worker_classes=(), cache_schemes=()):
+    """Collect the packages every installer needs into one resolver."""
+    from .core.cache_installer import CacheInstaller
+    from .core.dependency_resolver import DependencyResolver
+    from .core.gunicorn_config import GunicornConfig
+
+    resolver = DependencyResolver(wheelhouse=wheelhouse)
+    for installer in get_installers():
+        resolver.require(installer.REQUIREMENTS)
+    for worker_class in worker_classes:
+        resolver.require(GunicornConfig.WORKER_REQUIREMENTS.get(worker_class, ()))
+    for scheme in cache_schemes:
+        resolver.require(CacheInstaller.BACKEND_REQUIREMENTS.get(scheme, ()))
+    return resolver
+
+def prefetch(args):
+    """Populate the offline caches on a machine with network access."""
+    if not args.wheelhouse and not args.npm_cache:
+        print("Nothing to prefetch: pass --wheelhouse and/or --npm-cache")
+        sys.exit(1)
+    from .core.npm_cache import NpmCache
+
+    resolver = get_resolver()
+    if args.wheelhouse:
+        get_resolver(args.wheelhouse, WORKER_CLASSES, CACHE_SCHEMES).prefetch()
+    if args.npm_cache:
+        # The npm templates ship with django-tailwind, so it has to be installed
+        resolver.install()
+        NpmCache(args.npm_cache).prefetch()
+
+def update(args, spec, base_installer, report):
+    """Update an existing project in place, or add apps to it."""
+    from .core.project_updater import ProjectUpdater, locate_project
+
+    project_name = args.project or (spec.name if spec else None)
+    project_dir = locate_project(base_installer.projects_dir, project_name)
+    updater = ProjectUpdater(
+        project_dir, spec=spec, blueprints=args.blueprints,
+        squash_migrations=args.squash_migrations, report=report,
+    )
+    if args.command == "add-app":
+        updater.add_apps([app.strip().lower() for app in args.apps])
+    else:
+        updater.update()
+    report.write(project_dir.parent / f"{project_dir.name}.report.json")
+    if args.timings:
+        report.print_table()
+
+def main(argv=None):
+    args = parse_args(argv)
     try:
+        if args.command == "prefetch":
+            prefetch(args)
+            return
+
+        specs = None
+        if args.command == "batch":
+            specs = load_project_specs(args.file)
+        elif args.config:
+            specs = load_project_specs(args.config)
+            if len(specs) != 1:
+                raise Exception(f"{args.config} describes {len(specs)} projects; use `django-starter batch`")
+
+        from .core.base_installer import BaseInstaller
+        from .core.project_builder import ProjectBuilder, build_batch
+        from .core.run_report import RunReport
+        from .core.skeleton_cache import default_cache_dir
+
         # Initialize installers
         base_installer = BaseInstaller()
         base_installer.welcome_message()
         base_installer.verify_env()
 
-        # Cleanup previous projects
-        base_installer.cleanup()
-
-        # Get project name
-        django_installer = DjangoInstaller()
-        project_name = django_installer.get_project_name()
-
-        # Setup project directory
-        project_dir = base_installer.setup_project_directory(project_name)
-
-        # Create Django project
-        django_installer.create_django_project(project_dir)
-
-        # Install and configure Tailwind
-        tailwind_installer = TailwindInstaller(project_name)
-        tailwind_installer.install()
+        # Resolve every installer's packages up front, with one pip call at most
+        report = RunReport(profile=args.profile)
+        worker_classes = {args.worker_class}
+        worker_classes.update(spec.worker_class for spec in specs or () if spec.worker_class)
+        cache_schemes = {cache_scheme(args.cache_url)}
+        cache_schemes.update(cache_scheme(spec.cache_url) for spec in specs or () if spec.cache_url)
+        with report.measure("install_packages"):
+            get_resolver(args.wheelhouse, worker_classes, cache_schemes).install()
 
-        # Create base templates
-        template_creator = BaseTemplateCreator(project_name)
-        template_creator.create_base_templates()
+        if args.command in ("update", "add-app"):
+            update(args, specs[0] if specs else None, base_installer, report)
+            return
 
-        # Create main app (home) and additional apps
-        app_creator = AppTemplateCreator(project_name)
-        created_apps = app_creator.create_apps()  # No need to pass main_app anymore
+        base_installer.prepare_projects_directory()
 
-        # Install and configure Unfold
-        unfold_installer = UnfoldInstaller(project_name)  # Only pass project_name
-        unfold_installer.install()
+        options = {
+            "jobs": args.jobs,
+            "wheelhouse": args.wheelhouse,
+            "npm_cache": args.npm_cache,
+            "skeleton_cache": None if args.no_skeleton_cache else args.skeleton_cache or default_cache_dir(),
+            "database": args.database,
+            "settings_profile": args.settings_profile,
+            "worker_class": args.worker_class,
+            "cache_url": args.cache_url,
+            "blueprints": args.blueprints,
+            "show_timings": args.timings,
+        }
 
-        # Set up URL routing
-        django_installer.configure_main_app_routing()  # No parameter needed
+        if args.command == "batch":
+            created, failed = build_batch(
+                specs, processes=args.processes, profile=args.profile, **options
+            )
+            print(f"\nCreated {len(created)} of {len(specs)} projects in {base_installer.projects_dir}")
+            if failed:
+                sys.exit(1)
+            return
 
-        # Run initial setup
-        django_installer.run_initial_setup()
+        builder = ProjectBuilder(specs[0] if specs else None, report=report, **options)
+        project_name, created_apps = builder.build()
 
         base_installer.show_next_steps(project_name, created_apps)
 
@@ -59,4 +273,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
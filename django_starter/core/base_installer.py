@@ -3,6 +3,7 @@
 import os
 import sys
 import shutil
+import uuid
 from pathlib import Path
 from ..utils.messages import Messages
 from ..utils.validators import Validators
@@ -23,21 +24,52 @@ class BaseInstaller:
             sys.exit(1)
         print("✓ Virtual environment verified!")
 
-    def cleanup(self):
-        """Clean up previous projects."""
-        print("\nCleaning up previous projects...")
-        if self.projects_dir.exists():
-            shutil.rmtree(self.projects_dir)
+    def prepare_projects_directory(self):
+        """Create django_projects/, leaving the projects already in it alone.
+
+        A previous project is only replaced once a new build of the same
+        name has succeeded, see commit_project_directory().
+        """
         self.projects_dir.mkdir(exist_ok=True)
-        print("Cleanup completed!")
 
     def setup_project_directory(self, project_name):
-        """Create and set up project directory."""
+        """Create a staging directory for the project and change into it.
+
+        The project is built in a hidden sibling of django_projects/<name>
+        so a failed build never leaves a half-built project in its place.
+        """
+        staging_dir = self.projects_dir / f".{project_name}.{uuid.uuid4().hex[:8]}.staging"
+        staging_dir.mkdir(parents=True)
+        os.chdir(staging_dir)
+        return staging_dir
+
+    def commit_project_directory(self, staging_dir, project_name):
+        """Rename a finished staging directory to django_projects/<name>.
+
+        Renames within one directory are atomic, so the project appears
+        complete or not at all. A previous project of the same name is moved
+        aside first and only deleted once the new one is in place.
+        """
         project_dir = self.projects_dir / project_name
-        project_dir.mkdir(parents=True, exist_ok=True)
-        os.chdir(project_dir)
+        retired_dir = None
+        if project_dir.exists():
+            retired_dir = self.projects_dir / f".{project_name}.{uuid.uuid4().hex[:8]}.old"
+            os.rename(project_dir, retired_dir)
+        try:
+            os.rename(staging_dir, project_dir)
+        except OSError:
+            if retired_dir is not None:
+                os.rename(retired_dir, project_dir)
+            raise
+        if retired_dir is not None:
+            shutil.rmtree(retired_dir)
         return project_dir
 
+    def discard_project_directory(self, staging_dir):
+        """Remove the staging directory of a failed build."""
+        os.chdir(self.projects_dir)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
     def show_next_steps(self, project_name, created_apps):
         """Show next steps for the user."""
         print(self.messages.get_success_message(
@@ -0,0 +1,67 @@
+# File: django_starter/core/cache_installer.py
+
+from urllib.parse import urlparse
+from .pipeline import step
+from .project_spec import cache_scheme
+
+
+class CacheInstaller:
+    """Configure CACHES and the cache lifetime the generated views use.
+
+    locmem:// (the default) keeps a cache per process, file:///path shares
+    one between processes on a host and redis://host:port/db between hosts.
+    Pages are cached for CACHE_TTL seconds, which is 0, i.e. off, while
+    DEBUG is on.
+    """
+
+    REQUIREMENTS = []
+    # Extra requirements of the backends that need more than Django
+    BACKEND_REQUIREMENTS = {"redis": ["redis"], "rediss": ["redis"]}
+
+    def __init__(self, project_name, settings, cache_url="locmem://", main_app="home"):
+        self.project_name = project_name
+        self.settings = settings
+        self.cache_url = cache_url
+        self.scheme = cache_scheme(cache_url)
+        self.main_app = main_app
+
+    def _get_cache_config(self):
+        """Return the lines of the default cache's dict entries."""
+        if self.scheme == "locmem":
+            return [
+                '        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",\n',
+                f'        "LOCATION": "{self.project_name}",\n',
+            ]
+        if self.scheme == "file":
+            path = urlparse(self.cache_url).path
+            location = f'"{path}"' if path else 'BASE_DIR / ".cache"'
+            return [
+                '        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",\n',
+                f"        \"LOCATION\": os.environ.get(\"CACHE_LOCATION\", {location}),\n",
+            ]
+        return [
+            '        "BACKEND": "django.core.cache.backends.redis.RedisCache",\n',
+            f'        "LOCATION": os.environ.get("REDIS_URL", "{self.cache_url}"),\n',
+        ]
+
+    # The context processor lives in the main app, so wait for it to exist
+    @step(reads=["apps"], writes=["settings:cache", "settings:end"])
+    def update_settings(self):
+        """Add CACHES, CACHE_TTL and the context processor exposing it."""
+        self.settings.ensure_import("import os")
+        self.settings.append(
+            [
+                "\n# Cache\n",
+                "CACHES = {\n",
+                '    "default": {\n',
+                *self._get_cache_config(),
+                "    }\n",
+                "}\n",
+                "# Seconds pages and template fragments are cached for; 0 disables caching\n",
+                'CACHE_TTL = int(os.environ.get("CACHE_TTL", "0" if DEBUG else "900"))\n',
+                'TEMPLATES[0]["OPTIONS"]["context_processors"].append(\n',
+                f'    "{self.main_app}.context_processors.cache_ttl"\n',
+                ")\n",
+            ]
+        )
+        print(f"Configured {self.scheme} cache")
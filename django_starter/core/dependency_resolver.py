@@ -0,0 +1,105 @@
+# File: django_starter/core/dependency_resolver.py
+
+import importlib
+import subprocess
+import sys
+from importlib import metadata
+from pathlib import Path
+from packaging.requirements import Requirement
+from .pipeline import step
+from .run_report import run_command
+
+
+class DependencyResolver:
+    """Install the packages every installer needs with at most one pip call.
+
+    Installed distributions are checked in-process through importlib.metadata,
+    including the packages pulled in by requested extras, so a run where
+    setup.py's install_requires already did the work never starts pip.
+    With a wheelhouse, pip installs from that directory only and never
+    reaches the network.
+    """
+
+    def __init__(self, requirements=(), wheelhouse=None):
+        self.requirements = []
+        self.require(requirements)
+        self.wheelhouse = Path(wheelhouse).resolve() if wheelhouse else None
+
+    def require(self, requirements):
+        """Add requirements, ignoring ones that are already listed."""
+        for requirement in requirements:
+            if requirement not in self.requirements:
+                self.requirements.append(requirement)
+
+    def is_satisfied(self, requirement):
+        """Return True if the requirement and its extras are installed.
+
+        The installed version must match the requirement's specifier.
+        Requirements whose environment marker doesn't apply here are
+        satisfied, as pip would skip them.
+        """
+        requirement = Requirement(requirement)
+        if requirement.marker and not requirement.marker.evaluate({"extra": ""}):
+            return True
+        return self._is_installed(requirement)
+
+    def _is_installed(self, requirement):
+        try:
+            distribution = metadata.distribution(requirement.name)
+        except metadata.PackageNotFoundError:
+            return False
+        if not requirement.specifier.contains(distribution.version, prereleases=True):
+            return False
+
+        dependencies = [Requirement(dependency) for dependency in distribution.requires or []]
+        for extra in requirement.extras:
+            for dependency in dependencies:
+                # Only what the extra adds; the rest came with the distribution
+                marker = dependency.marker
+                if (
+                    marker
+                    and marker.evaluate({"extra": extra})
+                    and not marker.evaluate({"extra": ""})
+                    and not self._is_installed(dependency)
+                ):
+                    return False
+        return True
+
+    def missing(self):
+        """Return the requirements that still need to be installed."""
+        return [
+            requirement for requirement in self.requirements
+            if not self.is_satisfied(requirement)
+        ]
+
+    @step(writes=["packages"])
+    def install(self):
+        """Install every missing requirement in a single pip invocation."""
+        missing = self.missing()
+        if not missing:
+            print("✓ Required packages already installed!")
+            return
+
+        print(f"\nInstalling {', '.join(missing)}...")
+        command = [sys.executable, "-m", "pip", "install"]
+        if self.wheelhouse:
+            command += ["--no-index", "--find-links", str(self.wheelhouse)]
+        run_command([*command, *missing], check=True)
+        importlib.invalidate_caches()
+        print("Required packages installed successfully!")
+
+    def prefetch(self):
+        """Download every requirement and its dependencies into the wheelhouse."""
+        if not self.wheelhouse:
+            raise Exception("No wheelhouse directory configured")
+        print(f"\nDownloading packages into {self.wheelhouse}...")
+        self.wheelhouse.mkdir(parents=True, exist_ok=True)
+        subprocess.run(
+            [
+                sys.executable, "-m", "pip", "download",
+                "--dest", str(self.wheelhouse),
+                *self.requirements,
+            ],
+            check=True,
+        )
+        print(f"Wheelhouse ready at {self.wheelhouse}")
@@ -1,18 +1,47 @@
-import subprocess
+import os
 import sys
 from pathlib import Path
 from ..utils.validators import Validators
 from ..utils.timezone_selector import TimezoneSelector
+from ..utils.settings_document import SettingsDocument
+from .pipeline import step
+from .run_report import run_command, write_project_file
+from ..templates.template_generators.url_templates import get_project_urls_template
+
+# Runs inside `manage.py shell -c` so every command shares one Django boot.
+# collectstatic comes last so the Tailwind build is already in place.
+SETUP_SCRIPT = """
+from django.core.management import call_command
+
+call_command("makemigrations", interactive=False)
+call_command("migrate", interactive=False)
+call_command("collectstatic", interactive=False, verbosity=0)
+
+superuser = {superuser!r}
+if superuser:
+    call_command("createsuperuser", interactive=False, **superuser)
+"""
+
 
 class DjangoInstaller:
+    REQUIREMENTS = ["django"]
+
     def __init__(self):
         self.validators = Validators()
         self.project_name = None
         self.main_app_name = 'home'  # Fixed main app name
         self.timezone_selector = TimezoneSelector()
+        self.settings = None  # Shared SettingsDocument, loaded after startproject
+        self.apps = []  # Apps routed in urls.py, filled in as they are created
+
+    def get_project_name(self, name=None):
+        """Get and validate project name from user input, or check the given one."""
+        if name is not None:
+            if not self.validators.is_valid_identifier(name):
+                raise Exception(f"Project name {name!r} must be a valid Python identifier")
+            self.project_name = name
+            return name
 
-    def get_project_name(self):
-        """Get and validate project name from user input."""
         while True:
             name = input("\nEnter your project name: ").strip()
             if self.validators.is_valid_identifier(name):
@@ -20,10 +49,13 @@ class DjangoInstaller:
                 return name
             print("Project name must be a valid Python identifier")
 
-    def create_django_project(self, project_dir):
-        """Create the Django project structure."""
+    def create_django_project(self, project_dir, timezone=None):
+        """Create the Django project structure.
+
+        The timezone is chosen interactively unless one is given.
+        """
         print(f"\nCreating Django project: {self.project_name}")
-        subprocess.run(
+        run_command(
             [
                 sys.executable,
                 "-m",
@@ -35,96 +67,103 @@ class DjangoInstaller:
             check=True,
         )
 
+        self.settings = SettingsDocument(
+            Path(project_dir) / self.project_name / "settings.py"
+        )
+
         # Select and configure timezone
         print("\nConfiguring timezone...")
-        timezone = self.timezone_selector.select_timezone()
-        self.timezone_selector.update_settings(self.project_name, timezone)
+        if timezone is None:
+            timezone = self.timezone_selector.select_timezone()
+        elif not self.timezone_selector.is_valid(timezone):
+            raise Exception(f"Unknown timezone: {timezone}")
+        self.timezone_selector.update_settings(self.settings, timezone)
+        self.configure_debug_switch()
         print(f"Created Django project: {self.project_name} with timezone {timezone}")
 
+    def configure_debug_switch(self):
+        """Read DEBUG from DJANGO_DEBUG, keeping it on by default."""
+        self.settings.ensure_import("import os")
+        self.settings.set(
+            "DEBUG", 'os.environ.get("DJANGO_DEBUG", "True").lower() in ("1", "true", "yes")'
+        )
+
+    @step(reads=["apps"], writes=["settings:routing", "urls"])
     def configure_main_app_routing(self):
-        """Configure home app as homepage."""
-        settings_path = Path.cwd() / self.project_name / "settings.py"
+        """Write urls.py: home app as homepage, every other app under its name."""
         urls_path = Path.cwd() / self.project_name / "urls.py"
 
         # Update settings.py
-        with open(settings_path, "r") as f:
-            content = f.readlines()
-
-        for i, line in enumerate(content):
-            if "ROOT_URLCONF = " in line:
-                content.insert(i + 1, f"HOME_APP = '{self.main_app_name}'\n")
-                break
-
-        # Update Django settings
-        updated_settings = []
-        in_i18n_section = False
-        for line in content:
-            if '# Internationalization' in line:
-                in_i18n_section = True
-            if in_i18n_section and line.strip() == '':
-                in_i18n_section = False
-            if not in_i18n_section:
-                updated_settings.append(line)
-            elif 'LANGUAGE_CODE =' not in line and 'TIME_ZONE =' not in line:
-                updated_settings.append(line)
-
-        with open(settings_path, "w") as f:
-            f.writelines(updated_settings)
-
-        # Update urls.py to make home app the homepage
-        with open(urls_path, "w") as f:
-            f.write('''from django.contrib import admin
-from django.urls import path, include
-from django.conf import settings
-
-urlpatterns = [
-    path('admin/', admin.site.urls),
-    path("__reload__/", include("django_browser_reload.urls")),
-    path('', include(f"{settings.HOME_APP}.urls")),
-]
-''')
+        self.settings.set("HOME_APP", f"'{self.main_app_name}'", after="ROOT_URLCONF")
+        # urls.py reads HOME_APP, so publish it before the new urls.py lands
+        self.settings.flush()
+
+        write_project_file(urls_path, get_project_urls_template(self.apps, self.main_app_name))
+
+    def configure_database(self, database):
+        """Point the project at PostgreSQL, configured through POSTGRES_* variables."""
+        if database != "postgresql":
+            return
+        self.settings.ensure_import("import os")
+        self.settings.add_installed_apps(["django.contrib.postgres"])
+        self.settings.append(
+            [
+                "\n# PostgreSQL, replacing the SQLite database above\n",
+                "DATABASES = {\n",
+                '    "default": {\n',
+                '        "ENGINE": "django.db.backends.postgresql",\n',
+                f'        "NAME": os.environ.get("POSTGRES_DB", "{self.project_name}"),\n',
+                '        "USER": os.environ.get("POSTGRES_USER", "postgres"),\n',
+                '        "PASSWORD": os.environ.get("POSTGRES_PASSWORD", ""),\n',
+                '        "HOST": os.environ.get("POSTGRES_HOST", "localhost"),\n',
+                '        "PORT": os.environ.get("POSTGRES_PORT", "5432"),\n',
+                "    }\n",
+                "}\n",
+            ]
+        )
+        print("Configured PostgreSQL database")
 
     def configure_default_settings(self):
         """Configure default settings for the project."""
-        settings_path = Path.cwd() / self.project_name / "settings.py"
-
-        # Read current settings
-        with open(settings_path, "r") as f:
-            content = f.readlines()
-
-        # Find the Internationalization section and update it
-        i18n_settings = """
-# Internationalization
-# https://docs.djangoproject.com/en/5.1/topics/i18n/
-
-LANGUAGE_CODE = 'en-us'
-USE_I18N = True
-USE_TZ = True
-
-"""
-        # Update settings content
-        updated_content = []
-        skip_lines = 0
-        for i, line in enumerate(content):
-            if skip_lines > 0:
-                skip_lines -= 1
-                continue
-            if '# Internationalization' in line:
-                updated_content.append(i18n_settings)
-                # Skip existing i18n settings
-                skip_lines = 5  # Adjust this number based on your default settings structure
-            else:
-                updated_content.append(line)
-
-        # Write updated settings
-        with open(settings_path, "w") as f:
-            f.writelines(updated_content)
-
-    def run_initial_setup(self):
-        """Run initial Django setup including migrations and superuser creation."""
+        # Internationalization defaults; a TIME_ZONE chosen by the timezone
+        # selector is kept.
+        self.settings.set("LANGUAGE_CODE", "'en-us'", after="I18N")
+        self.settings.set("USE_I18N", "True", after="I18N")
+        self.settings.set("USE_TZ", "True", after="I18N")
+
+    def run_initial_setup(self, interactive=True, superuser=None):
+        """Run initial Django setup including migrations and superuser creation.
+
+        makemigrations, migrate, collectstatic and a non-interactive
+        createsuperuser all run through
+        call_command in one `manage.py shell` session, so Django boots and
+        opens the database once.
+
+        `superuser` ({"username", "email", "password_env"}) creates the
+        superuser without prompting; otherwise the user is asked, unless the
+        run is not interactive.
+        """
         print("\nRunning initial setup...")
-        subprocess.run([sys.executable, "manage.py", "makemigrations"], check=True)
-        subprocess.run([sys.executable, "manage.py", "migrate"], check=True)
+        self.settings.flush()
+
+        env = dict(os.environ)
+        superuser_args = None
+        if superuser is not None:
+            password_env = superuser.get("password_env")
+            if password_env:
+                if password_env not in os.environ:
+                    raise Exception(f"Environment variable {password_env} is not set")
+                env["DJANGO_SUPERUSER_PASSWORD"] = os.environ[password_env]
+            superuser_args = {
+                "username": superuser["username"],
+                "email": superuser.get("email", ""),
+            }
+
+        script = SETUP_SCRIPT.format(superuser=superuser_args)
+        run_command(
+            [sys.executable, "manage.py", "shell", "-c", script], check=True, env=env
+        )
 
-        if input("\nWould you like to create a superuser? (y/n): ").lower() == "y":
-            subprocess.run([sys.executable, "manage.py", "createsuperuser"], check=True)
\ No newline at end of file
+        if superuser is None and interactive:
+            if input("\nWould you like to create a superuser? (y/n): ").lower() == "y":
+                run_command([sys.executable, "manage.py", "createsuperuser"], check=True)
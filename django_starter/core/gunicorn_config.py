@@ -0,0 +1,33 @@
+# File: django_starter/core/gunicorn_config.py
+
+from pathlib import Path
+from .pipeline import step
+from .run_report import write_project_file
+from ..templates.template_generators.gunicorn_templates import (
+    WORKER_CLASSES,
+    get_gunicorn_config_template,
+)
+
+
+class GunicornConfig:
+    """Write gunicorn.conf.py next to manage.py."""
+
+    REQUIREMENTS = ["gunicorn"]
+    # Extra requirements of the worker classes that need more than gunicorn
+    WORKER_REQUIREMENTS = {"uvicorn": ["uvicorn-worker"]}
+
+    def __init__(self, project_name, worker_class="gthread"):
+        if worker_class not in WORKER_CLASSES:
+            raise Exception(f"Unknown worker class: {worker_class}")
+        self.base_dir = Path.cwd()
+        self.project_name = project_name
+        self.worker_class = worker_class
+
+    @step(writes=["gunicorn"])
+    def write(self):
+        """Write the gunicorn configuration."""
+        write_project_file(
+            self.base_dir / "gunicorn.conf.py",
+            get_gunicorn_config_template(self.project_name, self.worker_class),
+        )
+        print(f"Wrote gunicorn.conf.py ({self.worker_class} workers)")
@@ -0,0 +1,108 @@
+# File: django_starter/core/npm_cache.py
+
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+TEMPLATE_BLOCK_RE = re.compile(r"{%\s*if.*?%}.*?{%\s*endif\s*%}", re.DOTALL)
+TEMPLATE_VARIABLE_RE = re.compile(r"{{.*?}}")
+
+
+def dependency_key(package_json):
+    """Hash the dependency sections of a package.json.
+
+    Only the dependencies matter for a lock file, so the key ignores the app
+    name, scripts and formatting differences between the template and the
+    generated file.
+    """
+    data = json.loads(package_json)
+    dependencies = {
+        section: data.get(section, {})
+        for section in ("dependencies", "devDependencies")
+    }
+    return hashlib.sha256(
+        json.dumps(dependencies, sort_keys=True).encode()
+    ).hexdigest()[:16]
+
+
+def tailwind_package_templates():
+    """Return the npm-based package.json templates shipped with django-tailwind."""
+    spec = importlib.util.find_spec("tailwind")
+    if spec is None or spec.origin is None:
+        raise Exception("django-tailwind is not installed")
+    return sorted(Path(spec.origin).parent.glob("app_template*/*/static_src/package.json"))
+
+
+def render_package_template(content, app_name="theme"):
+    """Render a cookiecutter package.json with every optional block disabled."""
+    content = TEMPLATE_BLOCK_RE.sub("", content)
+    return TEMPLATE_VARIABLE_RE.sub(app_name, content)
+
+
+class NpmCache:
+    """Local npm cache plus the lock files resolved against it.
+
+    `prefetch` installs each django-tailwind template once with the cache
+    directory as npm's cache and keeps the resulting package-lock.json under
+    locks/. Theme installs then reuse that lock file and run npm offline,
+    so they resolve the same tree without touching the network.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir).resolve()
+        self.locks_dir = self.cache_dir / "locks"
+
+    def env(self):
+        """Return the environment for npm commands that must stay offline."""
+        env = dict(os.environ)
+        env.update({
+            "npm_config_cache": str(self.cache_dir),
+            "npm_config_offline": "true",
+            "npm_config_audit": "false",
+            "npm_config_fund": "false",
+            "npm_config_update_notifier": "false",
+        })
+        return env
+
+    def prefetch(self):
+        """Populate the cache for every npm-based Tailwind template."""
+        self.locks_dir.mkdir(parents=True, exist_ok=True)
+        for template in tailwind_package_templates():
+            package_json = render_package_template(template.read_text())
+            key = dependency_key(package_json)
+            print(f"Caching npm packages for {template.parents[2].name}...")
+
+            with tempfile.TemporaryDirectory() as work_dir:
+                Path(work_dir, "package.json").write_text(package_json)
+                subprocess.run(
+                    [
+                        "npm", "install",
+                        "--cache", str(self.cache_dir),
+                        "--ignore-scripts",
+                        "--no-audit",
+                        "--no-fund",
+                    ],
+                    cwd=work_dir,
+                    check=True,
+                )
+                shutil.copyfile(
+                    Path(work_dir, "package-lock.json"),
+                    self.locks_dir / f"{key}.json",
+                )
+        print(f"npm cache ready at {self.cache_dir}")
+
+    def restore_lock(self, static_src_dir):
+        """Copy the cached lock file matching a theme's package.json, if any."""
+        package_json = Path(static_src_dir) / "package.json"
+        lock = self.locks_dir / f"{dependency_key(package_json.read_text())}.json"
+        if not lock.exists():
+            print(f"No cached lock file for {package_json}; npm will resolve from the cache")
+            return False
+        shutil.copyfile(lock, Path(static_src_dir) / "package-lock.json")
+        return True
@@ -0,0 +1,211 @@
+# File: django_starter/core/project_builder.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from .base_installer import BaseInstaller
+from .django_installer import DjangoInstaller
+from .tailwind_installer import TailwindInstaller
+from .unfold_installer import UnfoldInstaller
+from .npm_cache import NpmCache
+from .skeleton_cache import SkeletonCache
+from .pipeline import Pipeline
+from .run_report import RunReport
+from .settings_profile import ProductionSettings
+from .gunicorn_config import GunicornConfig
+from .whitenoise_installer import WhiteNoiseInstaller
+from .cache_installer import CacheInstaller
+from .project_updater import ProjectManifest, generated_files
+from ..templates.base_template_creator import BaseTemplateCreator
+from ..templates.app_template_creator import AppTemplateCreator
+
+
+class ProjectBuilder:
+    """Create one project inside the current directory's django_projects/.
+
+    Without a spec every choice is prompted for; with a ProjectSpec the run
+    never reads stdin. Every step is timed into a RunReport, written next to
+    the project as <name>.report.json once the build ends. The project gets a
+    manifest of the options and files it was generated from, which
+    ProjectUpdater compares against later.
+    """
+
+    def __init__(self, spec=None, jobs=4, wheelhouse=None, npm_cache=None,
+                 skeleton_cache=None, profile=False,
+                 show_timings=False, report=None, database="sqlite",
+                 settings_profile="development", worker_class="gthread",
+                 cache_url="locmem://", blueprints=None):
+        self.spec = spec
+        self.database = database
+        self.settings_profile = settings_profile
+        self.worker_class = worker_class
+        self.cache_url = cache_url
+        self.blueprints = blueprints  # Path of a TOML file of app blueprints
+        self.report = report if report is not None else RunReport(profile=profile)
+        self.show_timings = show_timings
+        self.jobs = jobs
+        self.wheelhouse = wheelhouse
+        self.npm_cache = NpmCache(npm_cache) if npm_cache else None
+        self.skeleton_cache = SkeletonCache(skeleton_cache) if skeleton_cache else None
+        self.base_installer = BaseInstaller()
+        self.report_path = None  # <projects>/<name>.report.json once named
+
+    def build(self):
+        """Create the project and return its name and created apps."""
+        try:
+            with self.report.profiling():
+                return self._build()
+        finally:
+            if self.report_path is not None:
+                self.report.write(self.report_path)
+                if self.show_timings:
+                    self.report.print_table()
+
+    def _build(self):
+        spec = self.spec
+        report = self.report
+
+        # Get project name
+        django_installer = DjangoInstaller()
+        project_name = django_installer.get_project_name(spec.name if spec else None)
+
+        # Build in a staging directory, renamed into place once complete
+        staging_dir = self.base_installer.setup_project_directory(project_name)
+        self.report_path = self.base_installer.projects_dir / f"{project_name}.report.json"
+        report.root = staging_dir
+        try:
+            created_apps = self._build_project(django_installer, project_name, staging_dir)
+        except BaseException:
+            self.base_installer.discard_project_directory(staging_dir)
+            if self.skeleton_cache:
+                # The theme staged for the cache never got its node_modules
+                self.skeleton_cache.discard_theme()
+            raise
+        report.root = self.base_installer.commit_project_directory(staging_dir, project_name)
+        return project_name, created_apps
+
+    def _build_project(self, django_installer, project_name, project_dir):
+        """Create the project inside `project_dir`, returning the created apps."""
+        spec = self.spec
+        report = self.report
+
+        # Create Django project
+        with report.measure("create_django_project"):
+            django_installer.create_django_project(
+                project_dir, timezone=spec.timezone if spec else None
+            )
+        database = (spec.database if spec else None) or self.database
+        django_installer.configure_database(database)
+
+        settings = django_installer.settings
+        tailwind_installer = TailwindInstaller(
+            project_name,
+            settings=settings,
+            npm_cache=self.npm_cache,
+            wheelhouse=self.wheelhouse,
+            skeleton_cache=self.skeleton_cache,
+        )
+        template_creator = BaseTemplateCreator(project_name)
+        app_creator = AppTemplateCreator(
+            project_name, settings=settings, database=database, blueprints=self.blueprints
+        )
+        django_installer.apps = app_creator.created_apps
+        tailwind_installer.apps = app_creator.created_apps
+        unfold_installer = UnfoldInstaller(
+            project_name, settings=settings, wheelhouse=self.wheelhouse
+        )
+        whitenoise_installer = WhiteNoiseInstaller(settings)
+        cache_url = (spec.cache_url if spec else None) or self.cache_url
+        cache_installer = CacheInstaller(
+            project_name, settings, cache_url, main_app=app_creator.main_app
+        )
+        worker_class = (spec.worker_class if spec else None) or self.worker_class
+        gunicorn_config = GunicornConfig(project_name, worker_class)
+
+        # Settle every choice up front so the pipeline below never waits on stdin
+        if spec:
+            app_creator.set_additional_apps(spec.apps)
+        else:
+            app_creator.prompt_additional_apps()
+
+        # Steps run in this order when jobs=1; otherwise each one starts as
+        # soon as the steps it depends on (see their @step resources) are done.
+        # Profiling only follows the calling thread, so it runs them in order.
+        jobs = 1 if report.profiler else self.jobs
+        pipeline = Pipeline(jobs=jobs, report=report)
+        pipeline.add(tailwind_installer.update_initial_settings)
+        pipeline.add(tailwind_installer.initialize_tailwind)
+        pipeline.add(tailwind_installer.update_final_settings)
+        pipeline.add(tailwind_installer.install_dependencies)
+        pipeline.add(template_creator.create_base_templates)
+        pipeline.add(app_creator.create_apps)
+        pipeline.add(unfold_installer.update_settings)
+        pipeline.add(whitenoise_installer.update_settings)
+        pipeline.add(cache_installer.update_settings)
+        pipeline.add(tailwind_installer.build_tailwind_css)
+        pipeline.add(django_installer.configure_main_app_routing)
+        pipeline.add(gunicorn_config.write)
+        pipeline.run()
+
+        # Run initial setup
+        with report.measure("run_initial_setup"):
+            django_installer.run_initial_setup(
+                interactive=spec is None,
+                superuser=spec.superuser if spec else None,
+            )
+            settings.flush()
+        css_bundle = tailwind_installer.report_css_bundle(
+            project_dir / WhiteNoiseInstaller.STATIC_ROOT
+        )
+        if css_bundle:
+            report.artifacts["css"] = css_bundle
+
+        settings_profile = (spec.settings_profile if spec else None) or self.settings_profile
+        if settings_profile == "production":
+            with report.measure("write_production_settings"):
+                ProductionSettings(project_name, settings).write()
+
+        with report.measure("write_manifest"):
+            apps = app_creator.created_apps
+            options = {
+                "database": database,
+                "settings_profile": settings_profile,
+                "worker_class": worker_class,
+                "cache_url": cache_url,
+                "blueprints": str(self.blueprints) if self.blueprints else None,
+            }
+            files = generated_files(project_name, apps, app_creator, template_creator, worker_class)
+            ProjectManifest.from_disk(project_dir, project_name, apps, options, files).write(project_dir)
+
+        return app_creator.created_apps
+
+
+def _build_in_worker(spec, base_dir, options):
+    """Process pool entry point: build one project relative to base_dir."""
+    os.chdir(base_dir)
+    return ProjectBuilder(spec, **options).build()
+
+
+def build_batch(specs, processes=None, **options):
+    """Build several projects across a process pool.
+
+    Dependencies are expected to be resolved and the projects directory
+    prepared by the caller, once for the whole batch. Returns the created
+    apps of every successful project and the error of every failed one.
+    """
+    base_dir = os.getcwd()
+    created = {}
+    failed = {}
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = {
+            executor.submit(_build_in_worker, spec, base_dir, options): spec
+            for spec in specs
+        }
+        for future in as_completed(futures):
+            spec = futures[future]
+            try:
+                _, created[spec.name] = future.result()
+                print(f"✓ {spec.name} created")
+            except Exception as e:
+                failed[spec.name] = str(e)
+                print(f"❌ {spec.name} failed: {failed[spec.name]}")
+    return created, failed
@@ -0,0 +1,115 @@
+# File: django_starter/core/project_spec.py
+
+from urllib.parse import urlparse
+
+from ..templates.template_generators.gunicorn_templates import WORKER_CLASSES
+
+SPEC_KEYS = {
+    "name", "timezone", "apps", "superuser", "database", "settings_profile", "worker_class",
+    "cache_url",
+}
+SUPERUSER_KEYS = {"username", "email", "password_env"}
+# The choices of each option live here rather than in the installers using
+# them, so the command line can offer them without importing any installer
+DATABASES = ("sqlite", "postgresql")
+SETTINGS_PROFILES = ("development", "production")
+CACHE_SCHEMES = ("locmem", "file", "redis", "rediss")
+
+
+def cache_scheme(cache_url):
+    """Return the backend scheme of a --cache-url, rejecting unknown ones."""
+    scheme = urlparse(cache_url).scheme
+    if scheme not in CACHE_SCHEMES:
+        raise Exception(f"Unsupported cache URL {cache_url!r}: use locmem://, file:///path or redis://")
+    return scheme
+
+
+class ProjectSpec:
+    """Everything the interactive prompts would otherwise ask for."""
+
+    def __init__(self, name, timezone="UTC", apps=(), superuser=None, database=None,
+                 settings_profile=None, worker_class=None, cache_url=None):
+        self.name = name
+        self.timezone = timezone
+        self.apps = list(apps)
+        # {"username", "email", "password_env"} or None to skip createsuperuser
+        self.superuser = superuser
+        # One of DATABASES, or None to use the command line's --database
+        self.database = database
+        # One of SETTINGS_PROFILES, or None to use --settings-profile
+        self.settings_profile = settings_profile
+        # One of WORKER_CLASSES, or None to use --worker-class
+        self.worker_class = worker_class
+        # locmem://, file:///path or redis://..., or None to use --cache-url
+        self.cache_url = cache_url
+
+    @classmethod
+    def from_dict(cls, data, source="config"):
+        """Build a spec from a parsed TOML table, rejecting unknown keys."""
+        unknown = set(data) - SPEC_KEYS
+        if unknown:
+            raise Exception(f"Unknown keys in {source}: {', '.join(sorted(unknown))}")
+        if "name" not in data:
+            raise Exception(f"Missing project name in {source}")
+
+        superuser = data.get("superuser")
+        if superuser is not None:
+            unknown = set(superuser) - SUPERUSER_KEYS
+            if unknown:
+                raise Exception(f"Unknown superuser keys in {source}: {', '.join(sorted(unknown))}")
+            if "username" not in superuser:
+                raise Exception(f"Missing superuser username in {source}")
+        if data.get("database", DATABASES[0]) not in DATABASES:
+            raise Exception(f"Unknown database in {source}: {data['database']}")
+        if data.get("settings_profile", SETTINGS_PROFILES[0]) not in SETTINGS_PROFILES:
+            raise Exception(f"Unknown settings profile in {source}: {data['settings_profile']}")
+        if data.get("worker_class", WORKER_CLASSES[0]) not in WORKER_CLASSES:
+            raise Exception(f"Unknown worker class in {source}: {data['worker_class']}")
+        if "cache_url" in data and urlparse(data["cache_url"]).scheme not in CACHE_SCHEMES:
+            raise Exception(f"Unsupported cache URL in {source}: {data['cache_url']}")
+
+        return cls(
+            data["name"],
+            timezone=data.get("timezone", "UTC"),
+            apps=data.get("apps", ()),
+            superuser=superuser,
+            database=data.get("database"),
+            settings_profile=data.get("settings_profile"),
+            worker_class=data.get("worker_class"),
+            cache_url=data.get("cache_url"),
+        )
+
+    def __repr__(self):
+        return f"ProjectSpec({self.name!r})"
+
+
+def load_project_specs(path):
+    """Load project specs from a TOML file.
+
+    A file describes either one project through top-level keys, or several
+    through [[projects]] tables. In the latter case the top-level keys are
+    defaults shared by every project.
+    """
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        import tomli as tomllib
+
+    with open(path, "rb") as file:
+        data = tomllib.load(file)
+
+    projects = data.pop("projects", None)
+    if projects is None:
+        return [ProjectSpec.from_dict(data, source=str(path))]
+
+    specs = []
+    for i, project in enumerate(projects):
+        merged = dict(data)
+        merged.update(project)
+        specs.append(ProjectSpec.from_dict(merged, source=f"{path} projects[{i}]"))
+
+    names = [spec.name for spec in specs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise Exception(f"Duplicate project names in {path}: {', '.join(duplicates)}")
+    return specs
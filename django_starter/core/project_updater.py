@@ -0,0 +1,317 @@
+# File: django_starter/core/project_updater.py
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from .run_report import RunReport, run_command, write_project_file
+from .tailwind_installer import TailwindInstaller
+from ..templates.app_template_creator import AppTemplateCreator
+from ..templates.base_template_creator import BaseTemplateCreator
+from ..templates.template_generators.gunicorn_templates import get_gunicorn_config_template
+from ..templates.template_generators.url_templates import get_project_urls_template
+from ..utils.project_files import ProjectFiles
+from ..utils.settings_document import SettingsDocument
+from ..utils.source_editor import SourceEditor
+
+MANIFEST_NAME = ".django-starter.json"
+
+# Runs inside `manage.py shell -c` so every command shares one Django boot
+UPDATE_SCRIPT = """
+import importlib
+from django.core.management import call_command
+from django.db.migrations.loader import MigrationLoader
+
+apps = {migrate_apps!r}
+if apps:
+    call_command("makemigrations", *apps, interactive=False)
+for app in {squash_apps!r}:
+    # Django can't squash a squashed migration again, so squash the
+    # migrations made since the app's last squash
+    migrations = {{
+        name: migration
+        for (label, name), migration in MigrationLoader(None).disk_migrations.items()
+        if label == app
+    }}
+    replaced = {{name for migration in migrations.values() for _, name in migration.replaces}}
+    unsquashed = sorted(
+        name for name, migration in migrations.items()
+        if not migration.replaces and name not in replaced
+    )
+    if len(unsquashed) > 1:
+        call_command("squashmigrations", app, unsquashed[0], unsquashed[-1], interactive=False)
+        importlib.invalidate_caches()
+if apps:
+    call_command("migrate", interactive=False)
+if {collectstatic!r}:
+    call_command("collectstatic", interactive=False, verbosity=0)
+"""
+
+
+def generated_files(project_name, apps, app_creator, template_creator, worker_class):
+    """Return {path within the project: content} for every generated file."""
+    files = dict(app_creator.render_files(apps))
+    files.update(template_creator.render_files())
+    files[f"{project_name}/urls.py"] = get_project_urls_template(apps, app_creator.main_app)
+    files["gunicorn.conf.py"] = get_gunicorn_config_template(project_name, worker_class)
+    return files
+
+
+def locate_project(projects_dir, project_name=None):
+    """Return the directory of an existing generated project.
+
+    That is projects_dir/<project_name> when a name is given, else the
+    current directory when it holds a project, else the only project in
+    projects_dir.
+    """
+    if project_name:
+        project_dir = Path(projects_dir) / project_name
+        if not (project_dir / MANIFEST_NAME).exists():
+            raise Exception(f"No project named {project_name} in {projects_dir}")
+        return project_dir
+    if (Path.cwd() / MANIFEST_NAME).exists():
+        return Path.cwd()
+    found = sorted(path.parent for path in Path(projects_dir).glob(f"*/{MANIFEST_NAME}"))
+    if len(found) != 1:
+        names = ", ".join(path.name for path in found) or "none"
+        raise Exception(f"Name the project to use; projects in {projects_dir}: {names}")
+    return found[0]
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path):
+    """Return the hash of a file's content, or None if it doesn't exist."""
+    try:
+        with open(path, "rb") as file:
+            return content_hash(file.read())
+    except FileNotFoundError:
+        return None
+
+
+class ProjectManifest:
+    """What a project was generated from, and a hash of every generated file.
+
+    Written as .django-starter.json in the project directory, so `update`
+    can tell files it may rewrite from files edited since.
+    """
+
+    def __init__(self, project_name, apps, options, files):
+        self.project_name = project_name
+        self.apps = list(apps)
+        # database, settings_profile, worker_class, cache_url and blueprints
+        self.options = dict(options)
+        self.files = dict(files)  # Path within the project -> content hash
+
+    @classmethod
+    def from_disk(cls, project_dir, project_name, apps, options, paths):
+        """Record the current content of the given generated files."""
+        files = {path: file_hash(Path(project_dir) / path) for path in paths}
+        return cls(project_name, apps, options, {p: h for p, h in files.items() if h})
+
+    @classmethod
+    def load(cls, project_dir):
+        path = Path(project_dir) / MANIFEST_NAME
+        if not path.exists():
+            raise Exception(f"{project_dir} has no {MANIFEST_NAME}; only projects "
+                            "created by this version of django-starter can be updated")
+        with open(path) as file:
+            data = json.load(file)
+        return cls(data["project"], data["apps"], data["options"], data["files"])
+
+    def write(self, project_dir):
+        from .. import __version__
+
+        data = {
+            "generator": f"django-starter {__version__}",
+            "project": self.project_name,
+            "apps": self.apps,
+            "options": self.options,
+            "files": dict(sorted(self.files.items())),
+        }
+        write_project_file(Path(project_dir) / MANIFEST_NAME, json.dumps(data, indent=2) + "\n")
+
+
+class ProjectUpdater:
+    """Regenerate an existing project in place, rewriting only what changed.
+
+    Every generated file is rendered in memory and compared with the
+    manifest. A file is rewritten only when its generated content changed
+    and the file still matches the manifest, so local edits are kept. Only
+    the stages whose inputs changed run afterwards: the Tailwind build and
+    collectstatic for templates, makemigrations and migrate for models.
+    With squash_migrations, the migrations an app gathered since its last
+    squash are squashed before migrating. Apps listed in `spec` but missing
+    from the project are added.
+    """
+
+    def __init__(self, project_dir, spec=None, blueprints=None, squash_migrations=False,
+                 report=None):
+        self.project_dir = Path(project_dir)
+        self.spec = spec
+        self.blueprints = blueprints
+        self.squash_migrations = squash_migrations  # Squash the migrations update makes
+        self.report = report if report is not None else RunReport()
+
+    def update(self):
+        """Bring the project up to date and return the apps that were added."""
+        manifest, settings = self._load()
+        wanted = manifest.apps + [app for app in (self.spec.apps if self.spec else ()) if app not in manifest.apps]
+        app_creator, apps = self._app_creator(manifest, settings, wanted)
+        new_apps = [app for app in apps if app not in manifest.apps]
+
+        with self.report.measure("render_files"):
+            files = generated_files(
+                manifest.project_name,
+                apps,
+                app_creator,
+                BaseTemplateCreator(manifest.project_name),
+                manifest.options["worker_class"],
+            )
+            written, kept = self._write_changes(manifest, files)
+
+        if new_apps:
+            print(f"\nAdding apps: {', '.join(new_apps)}")
+            self._register_apps(manifest, settings, app_creator, new_apps)
+        self._rebuild(manifest, settings, apps, written)
+
+        manifest.apps = apps
+        manifest.write(self.project_dir)
+        print(f"\nUpdated {len(written)} files, kept {len(kept)} edited locally, "
+              f"{len(files) - len(written) - len(kept)} unchanged")
+        return new_apps
+
+    def add_apps(self, app_names):
+        """Generate new apps in the project and wire them into it.
+
+        Only the new apps' files are written. INSTALLED_APPS and urlpatterns
+        are patched in place and migrations are made for the new apps alone.
+        """
+        manifest, settings = self._load()
+        app_creator, apps = self._app_creator(manifest, settings, manifest.apps + list(app_names))
+        new_apps = [app for app in apps if app not in manifest.apps]
+        for app in new_apps:
+            if (self.project_dir / app).exists():
+                raise Exception(f"Cannot create app {app}: {self.project_dir / app} already exists")
+
+        with self.report.measure("create_apps"):
+            files = ProjectFiles(self.project_dir)
+            written = []
+            for app in new_apps:
+                print(f"\nCreating app: {app}")
+                for path, content in app_creator.render_files([app]):
+                    files.stage(path, content)
+                    manifest.files[path] = content_hash(content.encode())
+                    written.append(path)
+            files.commit()
+            self._register_apps(manifest, settings, app_creator, new_apps)
+        self._rebuild(manifest, settings, apps, written)
+
+        manifest.apps = apps
+        manifest.write(self.project_dir)
+        print(f"\nAdded apps: {', '.join(new_apps)}")
+        return new_apps
+
+    def _load(self):
+        """Load the manifest, change into the project and open its settings."""
+        manifest = ProjectManifest.load(self.project_dir)
+        if self.blueprints:
+            manifest.options["blueprints"] = str(self.blueprints)
+        os.chdir(self.project_dir)
+        self.report.root = self.project_dir
+        return manifest, SettingsDocument(self._settings_path(manifest))
+
+    def _settings_path(self, manifest):
+        """Return the module holding INSTALLED_APPS for the project's profile."""
+        package = self.project_dir / manifest.project_name
+        if manifest.options["settings_profile"] == "production":
+            return package / "settings" / "base.py"
+        return package / "settings.py"
+
+    def _app_creator(self, manifest, settings, app_names):
+        """Return an AppTemplateCreator for `app_names` and the full app list."""
+        app_creator = AppTemplateCreator(
+            manifest.project_name,
+            settings=settings,
+            database=manifest.options["database"],
+            blueprints=manifest.options.get("blueprints"),
+        )
+        fixed_apps = [app_creator.main_app] + app_creator.required_apps
+        app_creator.set_additional_apps([app for app in app_names if app not in fixed_apps])
+        return app_creator, fixed_apps + app_creator.additional_apps
+
+    def _register_apps(self, manifest, settings, app_creator, new_apps):
+        """Add the new apps to INSTALLED_APPS and the project's urlpatterns.
+
+        Both files are patched through SourceEditor, so whatever was added
+        to them by hand stays in place.
+        """
+        settings_editor = SourceEditor(settings.path)
+        settings_editor.add_strings("INSTALLED_APPS", new_apps)
+        settings_editor.flush()
+
+        urls_path = f"{manifest.project_name}/urls.py"
+        urls_editor = SourceEditor(self.project_dir / urls_path)
+        urls_editor.add_to_list("urlpatterns", [
+            f'path("{app}/", include("{app}.urls", namespace="{app}"))' for app in new_apps
+        ])
+        urls_editor.flush()
+        # Still exactly what would be generated: later updates may rewrite it
+        apps = [app_creator.main_app] + app_creator.required_apps + app_creator.additional_apps
+        generated = get_project_urls_template(apps, app_creator.main_app)
+        if urls_editor.render() == generated:
+            manifest.files[urls_path] = content_hash(generated.encode())
+
+    def _rebuild(self, manifest, settings, apps, written):
+        """Run the build stages whose inputs are among the `written` paths."""
+        templates_changed = any(path.endswith(".html") for path in written)
+        if templates_changed:
+            with self.report.measure("build_tailwind_css"):
+                tailwind_installer = TailwindInstaller(manifest.project_name, settings=settings)
+                tailwind_installer.apps = apps
+                tailwind_installer.build_tailwind_css()
+
+        migrate_apps = sorted({
+            path.split("/", 1)[0] for path in written
+            if path.endswith("/models.py") or "/migrations/" in path
+        })
+        if migrate_apps or templates_changed:
+            with self.report.measure("migrate_and_collectstatic"):
+                script = UPDATE_SCRIPT.format(
+                    migrate_apps=migrate_apps,
+                    squash_apps=migrate_apps if self.squash_migrations else [],
+                    collectstatic=templates_changed,
+                )
+                run_command([sys.executable, "manage.py", "shell", "-c", script], check=True)
+
+    def _write_changes(self, manifest, files):
+        """Write the generated files that changed and aren't edited locally.
+
+        Returns the paths written and the paths kept because they no longer
+        match the manifest. The manifest is updated to match what is on disk.
+        """
+        staged = ProjectFiles(self.project_dir)
+        written = []
+        kept = []
+        for path, content in files.items():
+            new_hash = content_hash(content.encode())
+            recorded_hash = manifest.files.get(path)
+            disk_hash = file_hash(self.project_dir / path)
+            if disk_hash == new_hash:
+                manifest.files[path] = new_hash
+            elif new_hash == recorded_hash:
+                # Edited locally, but there is nothing new to bring in
+                continue
+            elif disk_hash == recorded_hash or (disk_hash is None and recorded_hash is None):
+                # Untouched since generated, or not generated before
+                staged.stage(path, content)
+                manifest.files[path] = new_hash
+                written.append(path)
+            else:
+                kept.append(path)
+                print(f"Keeping local edits to {path}")
+        staged.commit()
+        return written, kept
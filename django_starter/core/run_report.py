@@ -0,0 +1,203 @@
+# File: django_starter/core/run_report.py
+
+import cProfile
+import json
+import os
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# The report and record of the step running in the current thread, if any
+_current = threading.local()
+
+# Dependencies, collected static files and bytecode, which would swamp the
+# files a step generates and take most of the walk
+UNCOUNTED_DIRS = {"node_modules", "staticfiles", "__pycache__"}
+
+
+def run_command(args, **kwargs):
+    """subprocess.run that charges its wall time to the step running it."""
+    started_ns = time.time_ns()
+    start = time.perf_counter()
+    try:
+        return subprocess.run(args, **kwargs)
+    finally:
+        record = getattr(_current, "record", None)
+        if record is not None:
+            record["subprocess_seconds"] += time.perf_counter() - start
+            record["subprocesses"] += 1
+            _current.report._add_window(started_ns, record, subprocess=True)
+
+
+def count_written(path, size):
+    """Charge a file written in-process to the step running it, if any."""
+    report = getattr(_current, "report", None)
+    if report is not None:
+        report._add_written(path, size)
+
+
+def write_project_file(path, content):
+    """Write a text file and charge its bytes to the step running it."""
+    data = content.encode()
+    Path(path).write_bytes(data)
+    count_written(path, len(data))
+
+
+def modified_files_since(root, since_ns):
+    """Yield (path, mtime_ns, size) of the files below root modified at or after since_ns."""
+    directories = [str(root)]
+    while directories:
+        try:
+            entries = list(os.scandir(directories.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in UNCOUNTED_DIRS:
+                    directories.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                stat = entry.stat(follow_symlinks=False)
+                if stat.st_mtime_ns >= since_ns:
+                    yield entry.path, stat.st_mtime_ns, stat.st_size
+
+
+class RunReport:
+    """Wall time, subprocess time and bytes written for every setup step.
+
+    Subprocess time covers the commands started through run_command while a
+    step is being measured. Files written in-process (ProjectFiles, the
+    source editors, write_project_file) are charged to the step writing them
+    as they are written. Files written by subprocesses are counted once,
+    when the report is rendered, by one walk of the project that charges
+    each other modified file to the command, or failing that the step,
+    running at its modification time. Files linked from the skeleton cache
+    and the directories in UNCOUNTED_DIRS are not counted. With
+    profile=True a cProfile profile of the in-process work is collected as
+    well.
+    """
+
+    def __init__(self, root=None, profile=False):
+        self.root = root  # Project directory to measure bytes written in
+        self.profiler = cProfile.Profile() if profile else None
+        self.steps = []
+        self.artifacts = {}  # Sizes of built outputs, such as the CSS bundle
+        self.started = time.time()
+        self._commands = []  # (started_ns, finished_ns, record) of every subprocess
+        self._windows = []  # (started_ns, finished_ns, record) of every step
+        self._written = set()  # Paths written in-process, relative to root
+        self._walked = (None, {})  # Bytes the walk found per record, and for which steps
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, name):
+        """Record one step run inside the with block."""
+        record = {
+            "name": name,
+            "wall_seconds": 0.0,
+            "subprocess_seconds": 0.0,
+            "subprocesses": 0,
+            "bytes_written": 0,
+        }
+        previous = getattr(_current, "record", None), getattr(_current, "report", None)
+        _current.record, _current.report = record, self
+        started_ns = time.time_ns()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["wall_seconds"] = time.perf_counter() - start
+            _current.record, _current.report = previous
+            with self._lock:
+                self.steps.append(record)
+            self._add_window(started_ns, record)
+
+    def _add_window(self, started_ns, record, subprocess=False):
+        with self._lock:
+            windows = self._commands if subprocess else self._windows
+            windows.append((started_ns, time.time_ns(), record))
+
+    def _add_written(self, path, size):
+        with self._lock:
+            _current.record["bytes_written"] += size
+            if self.root is not None:
+                self._written.add(os.path.relpath(os.path.abspath(path), self.root))
+
+    def bytes_written_by_subprocesses(self):
+        """Return the bytes of the files no step wrote in-process, per record id."""
+        if self._walked[0] == len(self._windows):
+            return self._walked[1]
+        walked = {}
+        if self._windows and self.root is not None and Path(self.root).exists():
+            # Most recently started first, so nested or overlapping windows
+            # charge the innermost one
+            commands = sorted(self._commands, key=lambda window: -window[0])
+            windows = sorted(self._windows, key=lambda window: -window[0])
+            since_ns = windows[-1][0]
+            for path, mtime_ns, size in modified_files_since(self.root, since_ns):
+                if os.path.relpath(path, self.root) in self._written:
+                    continue
+                for started_ns, finished_ns, record in commands + windows:
+                    if started_ns <= mtime_ns <= finished_ns:
+                        walked[id(record)] = walked.get(id(record), 0) + size
+                        break
+        self._walked = (len(self._windows), walked)
+        return walked
+
+    @contextmanager
+    def profiling(self):
+        """Profile the calling thread inside the with block, if enabled."""
+        if self.profiler is None:
+            yield
+            return
+        self.profiler.enable()
+        try:
+            yield
+        finally:
+            self.profiler.disable()
+
+    def to_dict(self):
+        walked = self.bytes_written_by_subprocesses()
+        steps = [
+            dict(record, bytes_written=record["bytes_written"] + walked.get(id(record), 0))
+            for record in sorted(self.steps, key=lambda record: -record["wall_seconds"])
+        ]
+        return {
+            "started": self.started,
+            "total_seconds": time.time() - self.started,
+            "steps": steps,
+            "artifacts": self.artifacts,
+        }
+
+    def write(self, path):
+        """Write the JSON report, and the profile next to it if one was taken."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+        print(f"\nBuild report written to {path}")
+        if self.profiler is not None:
+            profile_path = path.with_suffix(".prof")
+            self.profiler.dump_stats(profile_path)
+            print(f"Profile written to {profile_path} (view with `python -m pstats`)")
+
+    def print_table(self):
+        """Render the steps as a table, slowest first."""
+        from rich.console import Console
+        from rich.table import Table
+
+        report = self.to_dict()
+        table = Table(title=f"Build timings ({report['total_seconds']:.1f}s total)")
+        table.add_column("Step")
+        table.add_column("Wall", justify="right")
+        table.add_column("Subprocess", justify="right")
+        table.add_column("Written", justify="right")
+        for record in report["steps"]:
+            table.add_row(
+                record["name"],
+                f"{record['wall_seconds']:.2f}s",
+                f"{record['subprocess_seconds']:.2f}s ({record['subprocesses']})",
+                f"{record['bytes_written'] / 1024:.1f} KiB",
+            )
+        Console().print(table)
@@ -0,0 +1,72 @@
+# File: django_starter/core/settings_profile.py
+
+import os
+from pathlib import Path
+from .run_report import write_project_file
+from ..templates.template_generators.settings_templates import (
+    get_dev_settings_template,
+    get_prod_settings_template,
+    get_env_example_template,
+)
+
+
+class ProductionSettings:
+    """Split the generated settings.py into a base/dev/prod settings package.
+
+    base.py is the settings.py every installer wrote, loading .env through
+    python-dotenv. manage.py defaults to dev.py; wsgi.py and asgi.py default
+    to prod.py, which reads DATABASE_URL and keeps database connections open
+    or pooled.
+    """
+
+    REQUIREMENTS = ["python-dotenv"]
+
+    def __init__(self, project_name, settings):
+        self.base_dir = Path.cwd()
+        self.project_name = project_name
+        self.settings = settings
+
+    def write(self):
+        """Replace settings.py with the settings package."""
+        print("\nWriting production settings package...")
+        self.settings.ensure_import("import os")
+        self.settings.ensure_import("from dotenv import load_dotenv")
+        self.settings.flush()
+
+        project_package = self.base_dir / self.project_name
+        settings_path = project_package / "settings.py"
+        content = settings_path.read_text()
+
+        # base.py sits one directory deeper than settings.py did
+        base_dir_line = "BASE_DIR = Path(__file__).resolve().parent.parent\n"
+        if base_dir_line not in content:
+            raise Exception(f"Could not find BASE_DIR in {settings_path}")
+        content = content.replace(
+            base_dir_line,
+            "BASE_DIR = Path(__file__).resolve().parent.parent.parent\n"
+            "\nload_dotenv(BASE_DIR / \".env\")\n",
+        )
+
+        package = project_package / "settings"
+        package.mkdir()
+        (package / "__init__.py").touch()
+        write_project_file(package / "base.py", content)
+        write_project_file(package / "dev.py", get_dev_settings_template())
+        write_project_file(package / "prod.py", get_prod_settings_template())
+        os.remove(settings_path)
+
+        self._set_default_settings_module(self.base_dir / "manage.py", "dev")
+        for entry_point in ("wsgi.py", "asgi.py"):
+            self._set_default_settings_module(project_package / entry_point, "prod")
+
+        write_project_file(self.base_dir / ".env.example", get_env_example_template(self.project_name))
+        print("Production settings written to "
+              f"{self.project_name}/settings/ (see .env.example)")
+
+    def _set_default_settings_module(self, path, module):
+        """Point an entry point's DJANGO_SETTINGS_MODULE default at the package."""
+        content = path.read_text()
+        old = f"'{self.project_name}.settings'"
+        if old not in content:
+            raise Exception(f"Could not find DJANGO_SETTINGS_MODULE in {path}")
+        write_project_file(path, content.replace(old, f"'{self.project_name}.settings.{module}'"))
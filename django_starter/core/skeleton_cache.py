@@ -0,0 +1,161 @@
+# File: django_starter/core/skeleton_cache.py
+
+import hashlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+CACHED_PACKAGES = ("django", "django-tailwind", "django-unfold")
+
+
+def default_cache_dir():
+    """Return the per-user directory skeletons are cached in."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "django-starter" / "skeletons"
+
+
+def copy_tree(src, dst, link_dirs=(), link_all=False):
+    """Copy a directory tree, hard-linking files below any of `link_dirs`.
+
+    Symlinks are recreated as symlinks. Hard links fall back to a copy when
+    the two trees live on different filesystems.
+    """
+    src = Path(src)
+    for root, dirs, files in os.walk(src):
+        relative = Path(root).relative_to(src)
+        target_root = Path(dst) / relative
+        target_root.mkdir(parents=True, exist_ok=True)
+        link = link_all or any(part in link_dirs for part in relative.parts)
+
+        for name in dirs + files:
+            source = Path(root) / name
+            target = target_root / name
+            if source.is_symlink():
+                os.symlink(os.readlink(source), target)
+            elif name in files:
+                if link:
+                    try:
+                        os.link(source, target)
+                        continue
+                    except OSError:
+                        pass
+                shutil.copy2(source, target)
+
+
+class SkeletonCache:
+    """Content-addressed cache of the project-independent Tailwind theme app.
+
+    An entry holds the `theme` app as `tailwind init` creates it plus the
+    node_modules and package-lock.json from `tailwind install`. It is keyed on
+    the installed django, django-tailwind and django-unfold versions, the
+    starter version and the platform, so a hit can be linked into a new
+    project instead of re-running both commands. Everything that embeds the
+    project name, timezone, apps or secret key is still generated per run.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self._versions = None
+        self._staging = None
+
+    def versions(self):
+        """Return the inputs the cache key is derived from."""
+        if self._versions is not None:
+            return self._versions
+        from importlib import metadata
+        from .. import __version__
+
+        versions = {"django-starter": __version__}
+        for package in CACHED_PACKAGES:
+            try:
+                versions[package] = metadata.version(package)
+            except metadata.PackageNotFoundError:
+                versions[package] = None
+        versions["platform"] = f"{sys.platform}-{platform.machine()}"
+        try:
+            versions["node"] = subprocess.run(
+                ["node", "--version"], capture_output=True, text=True
+            ).stdout.strip()
+        except OSError:
+            versions["node"] = None
+        self._versions = versions
+        return versions
+
+    @property
+    def key(self):
+        versions = json.dumps(self.versions(), sort_keys=True)
+        return hashlib.sha256(versions.encode()).hexdigest()[:16]
+
+    @property
+    def entry(self):
+        return self.cache_dir / self.key
+
+    def has_theme(self):
+        """Return True if a complete theme for the current versions is cached."""
+        return (self.entry / "versions.json").exists()
+
+    def restore_theme(self, project_dir):
+        """Link the cached theme app into a project."""
+        print(f"\nRestoring Tailwind theme from cache ({self.key})...")
+        copy_tree(
+            self.entry / "theme",
+            Path(project_dir) / "theme",
+            link_dirs=("node_modules",),
+        )
+
+    def capture_theme(self, project_dir):
+        """Stage a copy of a freshly initialized theme app.
+
+        The copy is kept until store_theme publishes it or discard_theme
+        drops it.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._staging = self.cache_dir / f".{self.key}.{uuid.uuid4().hex}"
+        try:
+            copy_tree(Path(project_dir) / "theme", self._staging / "theme")
+        except BaseException:
+            self.discard_theme()
+            raise
+
+    def store_theme(self, project_dir):
+        """Add the installed npm packages to the staged theme and publish it."""
+        if self._staging is None:
+            return
+        staging, self._staging = self._staging, None
+        published = False
+        try:
+            static_src = Path(project_dir) / "theme" / "static_src"
+            cached_static_src = staging / "theme" / "static_src"
+            copy_tree(
+                static_src / "node_modules",
+                cached_static_src / "node_modules",
+                link_all=True,
+            )
+            lock = static_src / "package-lock.json"
+            if lock.exists():
+                shutil.copy2(lock, cached_static_src / "package-lock.json")
+            with open(staging / "versions.json", "w") as file:
+                json.dump(self.versions(), file, indent=2, sort_keys=True)
+
+            try:
+                # Another process may have published the same entry meanwhile
+                os.rename(staging, self.entry)
+                published = True
+                print(f"Cached Tailwind theme for later runs ({self.key})")
+            except OSError:
+                pass
+        finally:
+            if not published:
+                shutil.rmtree(staging, ignore_errors=True)
+
+    def discard_theme(self):
+        """Drop a theme staged by capture_theme that will not be stored."""
+        if self._staging is None:
+            return
+        staging, self._staging = self._staging, None
+        shutil.rmtree(staging, ignore_errors=True)
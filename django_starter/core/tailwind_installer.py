@@ -1,14 +1,38 @@
 # File: django_starter/core/tailwind_installer.py
 
-import subprocess
+import json
+import re
 import sys
 from pathlib import Path
+from .pipeline import step
+from .dependency_resolver import DependencyResolver
+from .run_report import run_command, write_project_file
+from ..utils.settings_document import SettingsDocument
+
+# The `content: [...]` list of the theme's tailwind.config.js
+CONTENT_RE = re.compile(r"^([ \t]*)content: \[.*?^\1\],?[ \t]*$", re.S | re.M)
+# Tailwind 4 themes import Tailwind and list their sources in src/styles.css
+TAILWIND_IMPORT_RE = re.compile(r"""^@import ["']tailwindcss["'][^;\n]*;""", re.M)
+SOURCE_RE = re.compile(r"^@source [^;\n]*;[ \t]*\n?", re.M)
+SOURCES_COMMENT = "Templates of the theme, the project and every app; add new apps here"
+CSS_PATH = "css/dist/styles.css"  # django-tailwind's default TAILWIND_CSS_PATH
 
 class TailwindInstaller:
-    def __init__(self, project_name):
+    REQUIREMENTS = ["django-tailwind[reload]"]
+
+    def __init__(self, project_name, settings=None, npm_cache=None, wheelhouse=None,
+                 skeleton_cache=None):
         self.base_dir = Path.cwd()
         self.project_name = project_name
+        self.npm_cache = npm_cache  # NpmCache for offline installs
+        self.wheelhouse = wheelhouse
+        self.skeleton_cache = skeleton_cache  # SkeletonCache holding a prebuilt theme
+        self.theme_restored = False
         self.settings_path = self.base_dir / project_name / "settings.py"
+        if settings is None:
+            settings = SettingsDocument(self.settings_path)
+        self.settings = settings
+        self.apps = []  # Created apps whose templates Tailwind scans
 
     def install(self):
         """Main installation method."""
@@ -25,138 +49,201 @@ class TailwindInstaller:
             # 4. Update settings with theme and browser reload
             self.update_final_settings()
 
-            # 5. Run migrations
-            self._run_migrations()
-
-            # 6. Install tailwind dependencies
+            # 5. Install tailwind dependencies
             self.install_dependencies()
 
-            # 7. Build Tailwind CSS
+            # 6. Build Tailwind CSS
             self.build_tailwind_css()
 
             print("\nTailwind CSS has been successfully installed and configured!")
         except Exception as e:
             raise Exception(f"Tailwind setup failed: {str(e)}")
 
+    @step(writes=["packages"])
     def install_tailwind_package(self):
         """Install Django Tailwind package."""
-        print("\nInstalling Django Tailwind...")
-        subprocess.run(
-            [sys.executable, "-m", "pip", "install", "django-tailwind[reload]"],
-            check=True,
-        )
-        print("Django Tailwind installed successfully!")
+        print("\nChecking Django Tailwind...")
+        DependencyResolver(self.REQUIREMENTS, wheelhouse=self.wheelhouse).install()
 
+    @step(writes=["settings:tailwind", "settings:installed_apps"])
     def update_initial_settings(self):
         """Add initial Tailwind configuration to settings."""
-        with open(self.settings_path, "r") as file:
-            content = file.readlines()
-
-        self._add_import_os(content)
+        self.settings.ensure_import("import os")
 
         # Add only tailwind to INSTALLED_APPS initially
-        for i, line in enumerate(content):
-            if "INSTALLED_APPS = [" in line:
-                insert_index = i + 1
-                content.insert(insert_index, "    'tailwind',\n")
-                break
-
-        with open(self.settings_path, "w") as file:
-            file.writelines(content)
+        self.settings.add_installed_apps(["tailwind"], first=True)
         print("Updated initial settings")
 
+    @step(reads=["packages", "settings:tailwind"], writes=["theme"])
     def initialize_tailwind(self):
         """Initialize Tailwind with theme app."""
+        if self.skeleton_cache and self.skeleton_cache.has_theme():
+            self.skeleton_cache.restore_theme(self.base_dir)
+            self.theme_restored = True
+            print("Tailwind theme restored successfully!")
+            return
+
         print("\nInitializing Tailwind theme...")
-        process = subprocess.Popen(
+        self.settings.flush()
+        process = run_command(
             [sys.executable, "manage.py", "tailwind", "init"],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            input="theme\n",
+            capture_output=True,
             text=True,
         )
-        stdout, stderr = process.communicate(input="theme\n")
 
         if process.returncode != 0:
-            raise Exception(f"Failed to initialize Tailwind: {stderr}")
+            raise Exception(f"Failed to initialize Tailwind: {process.stderr}")
+        if self.skeleton_cache:
+            self.skeleton_cache.capture_theme(self.base_dir)
         print("Tailwind theme initialized successfully!")
 
+    @step(
+        reads=["theme"],
+        writes=["settings:tailwind", "settings:installed_apps", "settings:middleware", "settings:end"],
+    )
     def update_final_settings(self):
         """Update settings after theme creation."""
-        with open(self.settings_path, "r") as file:
-            content = file.readlines()
-
         # Add theme and browser reload to INSTALLED_APPS
-        for i, line in enumerate(content):
-            if "INSTALLED_APPS = [" in line:
-                insert_index = i + 1
-                content.insert(insert_index, "    'theme',\n")
-                content.insert(insert_index, "    'django_browser_reload',\n")
-                break
+        self.settings.add_installed_apps(
+            ["django_browser_reload", "theme"], first=True
+        )
 
         # Add browser reload middleware
-        for i, line in enumerate(content):
-            if "MIDDLEWARE = [" in line:
-                content.insert(
-                    i + 1,
-                    '    "django_browser_reload.middleware.BrowserReloadMiddleware",\n',
-                )
-                break
+        self.settings.add_middleware(
+            ["django_browser_reload.middleware.BrowserReloadMiddleware"], first=True
+        )
 
         # Add Tailwind and IP configuration
-        content.extend(
+        self.settings.append(
             [
                 "\n# Tailwind configuration\n",
                 "TAILWIND_APP_NAME = 'theme'\n",
                 "\nINTERNAL_IPS = [\n",
                 '    "127.0.0.1",\n',
                 "]\n",
+                "\n# Development-only tooling, dropped when DEBUG is off. urls.py only\n",
+                "# mounts __reload__/ while django_browser_reload is installed.\n",
+                'DEV_APPS = ["django_browser_reload"]\n',
+                'DEV_MIDDLEWARE = ["django_browser_reload.middleware.BrowserReloadMiddleware"]\n',
+                "if not DEBUG:\n",
+                "    INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in DEV_APPS]\n",
+                "    MIDDLEWARE = [item for item in MIDDLEWARE if item not in DEV_MIDDLEWARE]\n",
             ]
         )
-
-        with open(self.settings_path, "w") as file:
-            file.writelines(content)
-
-        # Update urls.py
-        self._update_urls()
         print("Updated final settings")
 
-    def _update_urls(self):
-        """Add browser reload URLs."""
-        urls_path = self.base_dir / self.project_name / "urls.py"
-        with open(urls_path, "r") as file:
-            content = file.read()
-
-        if "django_browser_reload" not in content:
-            new_content = content.replace(
-                "from django.urls import path", "from django.urls import path, include"
-            )
-            new_content = new_content.replace(
-                "]\n",
-                '    path("__reload__/", include("django_browser_reload.urls")),\n]\n',
-            )
-
-            with open(urls_path, "w") as file:
-                file.write(new_content)
-
+    @step(reads=["theme", "settings:tailwind"], writes=["node_modules"])
     def install_dependencies(self):
         """Install Tailwind dependencies."""
+        if self.theme_restored:
+            print("\nTailwind dependencies restored from cache, skipping npm install")
+            return
+
         print("\nInstalling Tailwind dependencies...")
-        subprocess.run([sys.executable, "manage.py", "tailwind", "install"], check=True)
+        self.settings.flush()
+        env = None
+        if self.npm_cache:
+            self.npm_cache.restore_lock(self.base_dir / "theme" / "static_src")
+            env = self.npm_cache.env()
+        run_command(
+            [sys.executable, "manage.py", "tailwind", "install"], check=True, env=env
+        )
+        if self.skeleton_cache:
+            self.skeleton_cache.store_theme(self.base_dir)
         print("Tailwind dependencies installed successfully!")
 
+    def write_content_config(self):
+        """Limit the templates Tailwind scans to the theme and the created apps.
+
+        The stock globs walk the whole project, node_modules included, so list
+        each template directory instead: in tailwind.config.js's content list
+        on Tailwind 3 themes, as @source rules in src/styles.css on Tailwind 4.
+        """
+        static_src = self.base_dir / "theme" / "static_src"
+        config_path = static_src / "tailwind.config.js"
+        styles_path = static_src / "src" / "styles.css"
+        if config_path.exists() and CONTENT_RE.search(config_path.read_text()):
+            self.write_content_list(config_path)
+        elif styles_path.exists() and TAILWIND_IMPORT_RE.search(styles_path.read_text()):
+            self.write_source_rules(styles_path)
+        else:
+            print(f"Warning: no content list or @source rules found in {static_src}, "
+                  "Tailwind keeps scanning the whole project")
+
+    def template_globs(self, theme_dir):
+        """Template globs of the theme, the project and every app, relative to a theme file."""
+        globs = [f"{theme_dir}templates/**/*.html", f"{theme_dir}../templates/**/*.html"]
+        return globs + [f"{theme_dir}../{app}/templates/**/*.html" for app in self.apps]
+
+    def write_content_list(self, config_path):
+        """Replace the `content` list of a Tailwind 3 tailwind.config.js."""
+        config = config_path.read_text()
+        match = CONTENT_RE.search(config)
+        indent = match.group(1)
+        lines = [
+            f"{indent}content: [",
+            f"{indent}    // {SOURCES_COMMENT}",
+            *(f"{indent}    '{glob}'," for glob in self.template_globs("../")),
+            f"{indent}],",
+        ]
+        write_project_file(config_path, config[:match.start()] + "\n".join(lines) + config[match.end():])
+
+    def write_source_rules(self, styles_path):
+        """Replace the @source rules of a Tailwind 4 src/styles.css.
+
+        source(none) on the import turns off Tailwind's own scan of the
+        working directory, so only the listed templates are read.
+        """
+        styles = styles_path.read_text().replace(f"/* {SOURCES_COMMENT} */\n", "")
+        rules = "".join(
+            f'@source "{glob}";\n' for glob in self.template_globs("../../")
+        )
+        rules = f"/* {SOURCES_COMMENT} */\n" + rules
+        first = SOURCE_RE.search(styles)
+        if first:
+            styles = styles[:first.start()] + rules + SOURCE_RE.sub("", styles[first.end():])
+        else:
+            match = TAILWIND_IMPORT_RE.search(styles)
+            styles = styles[:match.end()] + "\n" + rules + "\n" + styles[match.end():].lstrip("\n")
+        styles = TAILWIND_IMPORT_RE.sub('@import "tailwindcss" source(none);', styles, count=1)
+        write_project_file(styles_path, styles)
+
+    @step(reads=["node_modules", "templates", "apps"], writes=["css"])
     def build_tailwind_css(self):
         """Build Tailwind CSS assets."""
         print("\nBuilding Tailwind CSS assets...")
-        subprocess.run([sys.executable, "manage.py", "tailwind", "build"], check=True)
+        if self.apps:
+            self.write_content_config()
+        self.settings.flush()
+        # The theme's build script already runs tailwindcss --minify
+        run_command([sys.executable, "manage.py", "tailwind", "build"], check=True)
         print("Tailwind CSS assets built successfully!")
 
-    def _run_migrations(self):
-        """Run Django migrations."""
-        print("\nRunning migrations...")
-        subprocess.run([sys.executable, "manage.py", "migrate"], check=True)
+    def report_css_bundle(self, static_root):
+        """Print and return the sizes of the collected CSS bundle.
+
+        collectstatic names the bundle after its content hash and writes gzip
+        and brotli copies next to it, so those are the bytes browsers load.
+        """
+        manifest = static_root / "staticfiles.json"
+        if manifest.exists():
+            name = json.loads(manifest.read_text())["paths"].get(CSS_PATH, CSS_PATH)
+            path = static_root / name
+        else:
+            name = CSS_PATH
+            path = self.base_dir / "theme" / "static" / CSS_PATH
+        if not path.exists():
+            print(f"No CSS bundle found at {path}")
+            return None
+
+        bundle = {"path": name, "bytes": path.stat().st_size}
+        sizes = [f"{bundle['bytes'] / 1024:.1f} KiB"]
+        for suffix, key in ((".gz", "gzip_bytes"), (".br", "brotli_bytes")):
+            compressed = path.with_name(path.name + suffix)
+            if compressed.exists():
+                bundle[key] = compressed.stat().st_size
+                sizes.append(f"{bundle[key] / 1024:.1f} KiB {suffix[1:]}")
+        print(f"CSS bundle {name}: {', '.join(sizes)}")
+        return bundle
 
-    def _add_import_os(self, content):
-        """Add OS import if not present."""
-        if not any("import os" in line for line in content):
-            content.insert(0, "import os\n")
\ No newline at end of file
@@ -1,185 +1,201 @@
 import sys
-import subprocess
 from pathlib import Path
-from .template_generators.admin_templates import get_admin_template
+from .template_generators.admin_templates import get_admin_template, get_paginator_template
 from .template_generators.view_templates import get_views_template
-from .template_generators.model_templates import get_models_template
+from .template_generators.model_templates import (
+    get_models_template,
+    get_trigram_migration_template,
+)
 from .template_generators.url_templates import get_urls_template
+from .template_generators.app_templates import (
+    get_apps_template,
+    get_tests_template,
+    get_benchmark_command_template,
+    get_warm_templates_command_template,
+)
+from .template_generators.cache_templates import (
+    get_cache_helpers_template,
+    get_signals_template,
+    get_context_processors_template,
+)
 from .template_generators.html_templates import (
     get_main_index_template,
     get_index_template,
     get_about_template
 )
+from .blueprints import BlueprintRegistry
+from ..utils.project_files import ProjectFiles
+from ..utils.validators import Validators
+from ..utils.settings_document import SettingsDocument
+from ..core.run_report import run_command
+from ..core.pipeline import step
 
 class AppTemplateCreator:
-    def __init__(self, project_name):
+    def __init__(self, project_name, in_process=True, settings=None, database="sqlite",
+                 blueprints=None):
         self.base_dir = Path.cwd()
         self.project_name = project_name
+        if settings is None:
+            settings = SettingsDocument(self.base_dir / project_name / "settings.py")
+        self.settings = settings
         self.created_apps = []
         self.main_app = 'home'  # Fixed main app name
-
+        self.required_apps = ['clients', 'orders']
+        self.additional_apps = None  # Filled by prompt_additional_apps()
+        # Render app skeletons directly instead of booting Django for every
+        # `manage.py startapp` call. Set to False to use Django's command.
+        self.in_process = in_process
+        self.database = database  # "postgresql" adds trigram search indexes
+        # Built-in blueprints, with the tables of a blueprints file over them
+        self.blueprints = BlueprintRegistry.load(*([blueprints] if blueprints else []))
+        self.validators = Validators()
+
+    def _check_app_name(self, app_name, taken):
+        """Return why an additional app name can't be used, or None."""
+        if app_name in taken:
+            return f"App {app_name} already exists. Please enter a different name."
+        if app_name in ['admin', 'auth', 'contenttypes', 'sessions']:
+            return f"Cannot create app named {app_name} as it conflicts with Django's internal apps."
+        if not self.validators.is_valid_identifier(app_name):
+            return "App name must be a valid Python identifier"
+        return None
+
+    def prompt_additional_apps(self):
+        """Ask for additional app names before anything is generated."""
+        self.additional_apps = []
+        taken = [self.main_app] + self.required_apps
+        while True:
+            additional_app = input("\nEnter additional app name (or press Enter to finish): ").strip().lower()
+            if not additional_app:
+                break
+            error = self._check_app_name(additional_app, taken + self.additional_apps)
+            if error:
+                print(error)
+                continue
+            self.additional_apps.append(additional_app)
+        return self.additional_apps
+
+    def set_additional_apps(self, app_names):
+        """Use the given additional app names instead of prompting for them."""
+        self.additional_apps = []
+        taken = [self.main_app] + self.required_apps
+        for app_name in app_names:
+            error = self._check_app_name(app_name, taken + self.additional_apps)
+            if error:
+                raise Exception(error)
+            self.additional_apps.append(app_name)
+        return self.additional_apps
+
+    # The apps go at the end of INSTALLED_APPS, where no other step adds any,
+    # so this needn't wait for the steps writing "settings:installed_apps"
+    @step(reads=["packages"], writes=["apps", "settings:apps"])
     def create_apps(self):
         """Create main app and additional apps."""
+        if self.additional_apps is None:
+            self.prompt_additional_apps()
+
+        # Every app's files are staged in memory and written in one batch
+        files = ProjectFiles(self.base_dir)
+
         # Create main app (home) first
         print(f"\nCreating main app: {self.main_app}")
         self.created_apps.append(self.main_app)
-        self._create_app(self.main_app, is_main=True)
+        self._create_app(files, self.main_app, is_main=True)
 
-        # Create required apps (clients and orders)
-        required_apps = ['clients', 'orders']
-        for app_name in required_apps:
+        # Create required apps (clients and orders) and additional apps
+        for app_name in self.required_apps + self.additional_apps:
             self.created_apps.append(app_name)
             print(f"\nCreating app: {app_name}")
-            self._create_app(app_name, is_main=False)
-
-        # Ask for additional apps
-        while True:
-            additional_app = input("\nEnter additional app name (or press Enter to finish): ").strip().lower()
-            if not additional_app:
-                break
-            if additional_app in self.created_apps:
-                print(f"App {additional_app} already exists. Please enter a different name.")
-                continue
-            if additional_app in ['admin', 'auth', 'contenttypes', 'sessions']:
-                print(f"Cannot create app named {additional_app} as it conflicts with Django's internal apps.")
-                continue
-            self.created_apps.append(additional_app)
-            print(f"\nCreating app: {additional_app}")
-            self._create_app(additional_app, is_main=False)
+            self._create_app(files, app_name, is_main=False)
 
+        files.commit()
         self._update_settings_with_apps()
-        self._update_main_urls()
         print("\nAll apps created successfully!")
         return self.created_apps
 
-    def _create_app(self, app_name, is_main=False):
-        """Create a single app with all necessary files."""
-        subprocess.run(
-            [sys.executable, "manage.py", "startapp", app_name],
-            check=True
+    def _create_app(self, files, app_name, is_main=False):
+        """Stage a single app with all necessary files in `files`."""
+        if self.in_process:
+            app_dir = self.base_dir / app_name
+            if app_dir.exists():
+                raise Exception(f"Cannot create app {app_name}: {app_dir} already exists")
+            files.stage_all(self._render_app_skeleton(app_name), prefix=app_name)
+        else:
+            self.settings.flush()
+            run_command(
+                [sys.executable, "manage.py", "startapp", app_name],
+                check=True
+            )
+        # Staged after the skeleton, so these replace startapp's placeholders
+        files.stage_all(self._render_app_files(app_name, is_main), prefix=app_name)
+
+    def render_files(self, app_names):
+        """Yield (path within the project, content) for every file of the apps."""
+        for app_name in app_names:
+            files = list(self._render_app_skeleton(app_name))
+            files += self._render_app_files(app_name, app_name == self.main_app)
+            for relative_path, content in files:
+                yield f"{app_name}/{relative_path}", content
+
+    def _render_app_skeleton(self, app_name):
+        """Yield the files `manage.py startapp` would create, without booting Django."""
+        yield "__init__.py", ""
+        yield "migrations/__init__.py", ""
+        yield "apps.py", get_apps_template(app_name)
+
+    def _searchable_models(self):
+        """Return the "app.Model" labels whose generated admin has search_fields."""
+        labels = set()
+        for app_name in [self.main_app] + self.required_apps + (self.additional_apps or []):
+            blueprint = self.blueprints.for_app(app_name)
+            if blueprint.search_fields:
+                labels.add(f"{app_name}.{blueprint.model}")
+        return labels
+
+    def _render_app_files(self, app_name, is_main):
+        """Yield (path within the app, content) for each file of the app."""
+        blueprint = self.blueprints.for_app(app_name)
+        postgres = self.database == "postgresql"
+
+        yield "urls.py", get_urls_template(app_name)
+        yield "tests.py", get_tests_template(app_name, is_main)
+        yield "views.py", get_views_template(app_name, self.project_name, is_main, self.main_app)
+        # Indexed for the admin configuration below
+        yield "models.py", get_models_template(blueprint, postgres=postgres)
+        yield "admin.py", get_admin_template(
+            blueprint,
+            is_main_app=is_main,
+            paginator_app=self.main_app if postgres else None,
+            searchable_models=self._searchable_models(),
         )
-        self._create_app_files(app_name, is_main)
-        self._create_templates_structure(app_name, is_main)
-
-    def _create_app_files(self, app_name, is_main):
-        """Create necessary files for the app."""
-        app_dir = self.base_dir / app_name
-
-        # Create urls.py
-        with open(app_dir / "urls.py", "w") as file:
-            file.write(get_urls_template(app_name))
-
-        # Create views.py
-        with open(app_dir / "views.py", "w") as file:
-            file.write(get_views_template(app_name, self.project_name, is_main))
-
-        # Create models.py
-        with open(app_dir / "models.py", "w") as file:
-            file.write(get_models_template(app_name))
-
-        # Create admin.py with appropriate configurations
-        list_display = self._get_list_display(app_name)
-        search_fields = self._get_search_fields(app_name)
-        list_filter = self._get_list_filter(app_name)
-        model_name = self._get_model_name(app_name)
-
-        with open(app_dir / "admin.py", "w") as file:
-            file.write(get_admin_template(
-                app_name,
-                model_name,
-                list_display,
-                search_fields,
-                list_filter,
-                is_main_app=(app_name == self.main_app)
-            ))
-
-    def _create_templates_structure(self, app_name, is_main):
-        """Create templates structure for the app."""
-        templates_dir = self.base_dir / app_name / "templates" / app_name
-        templates_dir.mkdir(parents=True, exist_ok=True)
+        if postgres:
+            # makemigrations makes the initial migration depend on this one
+            yield "migrations/0001_pg_trgm.py", get_trigram_migration_template()
 
         if is_main:
-            with open(templates_dir / "index.html", "w") as file:
-                file.write(get_main_index_template())
-            with open(templates_dir / "about.html", "w") as file:
-                file.write(get_about_template(app_name))
+            yield "management/__init__.py", ""
+            yield "management/commands/__init__.py", ""
+            yield "management/commands/benchmark_home.py", get_benchmark_command_template(app_name)
+            yield "management/commands/warm_templates.py", get_warm_templates_command_template()
+            # Page cache helpers, invalidated from signals connected in ready()
+            yield "apps.py", get_apps_template(app_name, is_main_app=True)
+            yield "cache.py", get_cache_helpers_template()
+            yield "signals.py", get_signals_template(app_name)
+            yield "context_processors.py", get_context_processors_template()
+            if postgres:
+                # Shared by every app's admin for estimated changelist counts
+                yield "paginators.py", get_paginator_template()
+
+        templates = f"templates/{app_name}"
+        if is_main:
+            yield f"{templates}/index.html", get_main_index_template()
         else:
-            with open(templates_dir / "index.html", "w") as file:
-                file.write(get_index_template(app_name))
-            with open(templates_dir / "about.html", "w") as file:
-                file.write(get_about_template(app_name))
+            yield f"{templates}/index.html", get_index_template(app_name)
+        yield f"{templates}/about.html", get_about_template(app_name)
 
     def _update_settings_with_apps(self):
         """Update settings.py to include the created apps."""
-        settings_path = self.base_dir / self.project_name / "settings.py"
-        with open(settings_path, "r") as file:
-            content = file.readlines()
-
-        for i, line in enumerate(content):
-            if "INSTALLED_APPS = [" in line:
-                insert_index = i + 1
-                while "]" not in content[insert_index]:
-                    insert_index += 1
-                for app in self.created_apps:
-                    content.insert(insert_index, f"    '{app}',\n")
-                break
-
-        with open(settings_path, "w") as file:
-            file.writelines(content)
-
-    def _update_main_urls(self):
-        """Update the main urls.py to include app URLs."""
-        urls_path = self.base_dir / self.project_name / "urls.py"
-        content = f"""from django.contrib import admin
-from django.urls import path, include
-
-urlpatterns = [
-    path('admin/', admin.site.urls),
-    path('__reload__/', include('django_browser_reload.urls')),
-    path('', include('{self.main_app}.urls')),  # Main app as homepage
-"""
-        # Add other apps with their own URL prefixes
-        for app in self.created_apps:
-            if app != self.main_app:
-                content += f'    path("{app}/", include("{app}.urls", namespace="{app}")),\n'
-
-        content += "]\n"
-
-        with open(urls_path, "w") as file:
-            file.write(content)
-
-    def _get_model_name(self, app_name):
-        """Get the model name for an app."""
-        if app_name == "clients":
-            return "Client"
-        elif app_name == "orders":
-            return "Order"
-        else:
-            return f"{app_name.capitalize()}Item"
-
-    def _get_list_display(self, app_name):
-        """Get list_display fields for admin."""
-        if app_name == "clients":
-            return '("first_name", "last_name", "email", "phone_number")'
-        elif app_name == "orders":
-            return '("client", "order_date", "delivery_date", "total_amount", "status")'
-        else:
-            return '("title", "created_at", "updated_at")'
-
-    def _get_search_fields(self, app_name):
-        """Get search_fields for admin."""
-        if app_name == "clients":
-            return '("first_name", "last_name", "email")'
-        elif app_name == "orders":
-            return '("client__first_name", "client__last_name", "status")'
-        else:
-            return '("title", "description")'
-
-    def _get_list_filter(self, app_name):
-        """Get list_filter fields for admin."""
-        if app_name == "clients":
-            return '("email",)'
-        elif app_name == "orders":
-            return '("order_date", "status")'
-        else:
-            return '("created_at", "updated_at")'
\ No newline at end of file
+        self.settings.add_installed_apps(self.created_apps)
+        # urls.py imports the new apps' views and models, which Django only
+        # accepts once they are installed, so publish the settings first.
+        self.settings.flush()
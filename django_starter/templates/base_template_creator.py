@@ -1,34 +1,28 @@
 from pathlib import Path
+from ..core.pipeline import step
+from ..utils.project_files import ProjectFiles
 
 class BaseTemplateCreator:
     def __init__(self, project_name):
         self.base_dir = Path.cwd()
         self.project_name = project_name
-        self.theme_templates = self.base_dir / "theme" / "templates"
 
+    @step(reads=["theme"], writes=["templates"])
     def create_base_templates(self):
         """Create base templates in the theme app."""
-        self.theme_templates.mkdir(parents=True, exist_ok=True)
-        self._create_base_html()
-        self._create_navbar_partial()
+        files = ProjectFiles(self.base_dir)
+        files.stage_all(self.render_files())
+        files.commit()
         print("Base templates created successfully!")
 
-    def _create_base_html(self):
-        """Create the base.html template."""
-        with open(self.theme_templates / "base.html", "w") as file:
-            file.write(self._get_base_template())
-
-    def _create_navbar_partial(self):
-        """Create the navbar partial template."""
-        partials_dir = self.theme_templates / "partials"
-        partials_dir.mkdir(exist_ok=True)
-
-        with open(partials_dir / "_navbar.html", "w") as file:
-            file.write(self._get_navbar_template())
+    def render_files(self):
+        """Yield (path within the project, content) for each base template."""
+        yield "theme/templates/base.html", self._get_base_template()
+        yield "theme/templates/partials/_navbar.html", self._get_navbar_template()
 
     def _get_base_template(self):
         """Return the content for base.html template."""
-        return '''{% load static tailwind_tags %}
+        return '''{% load static tailwind_tags cache %}
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -39,13 +33,16 @@ class BaseTemplateCreator:
 </head>
 <body class="bg-gray-100 min-h-screen flex flex-col">
     <header class="bg-white shadow-lg">
+        {% cache CACHE_TTL navbar %}
         {% include "partials/_navbar.html" %}
+        {% endcache %}
     </header>
 
     <main class="container mx-auto px-4 py-8 flex-grow">
         {% block content %}{% endblock %}
     </main>
 
+    {% cache CACHE_TTL footer %}
     <footer class="bg-gray-800 text-white mt-auto">
         <div class="container mx-auto px-4 py-6">
             <div class="flex flex-col md:flex-row justify-between items-center space-y-4 md:space-y-0">
@@ -58,6 +55,7 @@ class BaseTemplateCreator:
             </div>
         </div>
     </footer>
+    {% endcache %}
 </body>
 </html>'''
 
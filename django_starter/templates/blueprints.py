@@ -0,0 +1,136 @@
+# File: django_starter/templates/blueprints.py
+
+from functools import lru_cache
+from pathlib import Path
+
+BUILTIN_BLUEPRINTS = Path(__file__).parent / "blueprints.toml"
+DEFAULT_BLUEPRINT = "default"
+BLUEPRINT_KEYS = {
+    "model", "str", "relations", "fields", "ordering", "list_display",
+    "search_fields", "list_filter", "verbose_name", "verbose_name_plural",
+}
+
+
+class Blueprint:
+    """The model and admin configuration generated for one app.
+
+    Field tables keep their file order. Names may contain {App}, which
+    for_app() replaces with the capitalized app name.
+    """
+
+    __slots__ = (
+        "model", "str_expression", "relations", "fields", "ordering", "list_display",
+        "search_fields", "list_filter", "verbose_name", "verbose_name_plural",
+        "unique_fields",
+    )
+
+    def __init__(self, model, str_expression, fields=(), relations=(), ordering=(),
+                 list_display=(), search_fields=(), list_filter=(), verbose_name=None,
+                 verbose_name_plural=None):
+        self.model = model
+        self.str_expression = str_expression
+        self.fields = tuple(fields)  # (name, "models.Field(...)") pairs
+        self.relations = tuple(relations)  # (name, "app.Model") foreign keys
+        self.ordering = tuple(ordering)
+        self.list_display = tuple(list_display)
+        self.search_fields = tuple(search_fields)
+        self.list_filter = tuple(list_filter)
+        self.verbose_name = verbose_name
+        self.verbose_name_plural = verbose_name_plural
+        # Derived once here rather than by every template that needs them
+        self.unique_fields = tuple(
+            name for name, declaration in self.fields if "unique=True" in declaration
+        )
+
+    @classmethod
+    def from_dict(cls, data, source="blueprint"):
+        """Build a blueprint from a parsed TOML table, rejecting unknown keys."""
+        unknown = set(data) - BLUEPRINT_KEYS
+        if unknown:
+            raise Exception(f"Unknown keys in {source}: {', '.join(sorted(unknown))}")
+        missing = [key for key in ("model", "str", "fields") if key not in data]
+        if missing:
+            raise Exception(f"Missing {', '.join(missing)} in {source}")
+
+        names = list(data.get("relations", {})) + list(data["fields"])
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise Exception(f"Fields declared twice in {source}: {', '.join(duplicates)}")
+
+        return cls(
+            data["model"],
+            data["str"],
+            fields=data["fields"].items(),
+            relations=data.get("relations", {}).items(),
+            ordering=data.get("ordering", ()),
+            list_display=data.get("list_display", ()),
+            search_fields=data.get("search_fields", ()),
+            list_filter=data.get("list_filter", ()),
+            verbose_name=data.get("verbose_name"),
+            verbose_name_plural=data.get("verbose_name_plural"),
+        )
+
+    def for_app(self, app_name):
+        """Return this blueprint with {App} replaced for `app_name`."""
+        names = (self.model, self.verbose_name, self.verbose_name_plural)
+        if not any(name and "{App}" in name for name in names):
+            return self
+        app = app_name.capitalize()
+        model, verbose_name, verbose_name_plural = (
+            name.replace("{App}", app) if name else name for name in names
+        )
+        return Blueprint(
+            model,
+            self.str_expression,
+            fields=self.fields,
+            relations=self.relations,
+            ordering=self.ordering,
+            list_display=self.list_display,
+            search_fields=self.search_fields,
+            list_filter=self.list_filter,
+            verbose_name=verbose_name,
+            verbose_name_plural=verbose_name_plural,
+        )
+
+
+@lru_cache(maxsize=None)
+def load_blueprint_file(path):
+    """Parse a blueprint file once into a name -> Blueprint mapping."""
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        import tomli as tomllib
+
+    with open(path, "rb") as file:
+        data = tomllib.load(file)
+    return {
+        name: Blueprint.from_dict(table, source=f"{path} [{name}]")
+        for name, table in data.items()
+    }
+
+
+class BlueprintRegistry:
+    """Blueprints by app name, falling back to [default] for other apps."""
+
+    __slots__ = ("blueprints", "_bound")
+
+    def __init__(self, blueprints):
+        if DEFAULT_BLUEPRINT not in blueprints:
+            raise Exception(f"No [{DEFAULT_BLUEPRINT}] blueprint to generate other apps from")
+        self.blueprints = blueprints
+        self._bound = {}
+
+    @classmethod
+    def load(cls, *paths):
+        """Load the built-in blueprints, then each file's tables over them."""
+        blueprints = dict(load_blueprint_file(BUILTIN_BLUEPRINTS))
+        for path in paths:
+            blueprints.update(load_blueprint_file(Path(path).resolve()))
+        return cls(blueprints)
+
+    def for_app(self, app_name):
+        """Return the blueprint an app is generated from."""
+        if app_name not in self._bound:
+            blueprint = self.blueprints.get(app_name, self.blueprints[DEFAULT_BLUEPRINT])
+            self._bound[app_name] = blueprint.for_app(app_name)
+        return self._bound[app_name]
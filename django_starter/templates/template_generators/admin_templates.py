@@ -1,7 +1,52 @@
 """Admin template generator for Django apps."""
 
-def get_admin_template(app_name, model_name, list_display, search_fields, list_filter, is_main_app=False):
-    """Generate admin.py content for the app."""
+def format_fields(fields):
+    """Render field names as a tuple literal."""
+    items = ", ".join(f'"{field}"' for field in fields)
+    return f"({items},)" if len(fields) == 1 else f"({items})"
+
+def get_model_admin_options(list_display, relations=(), searchable_models=(), estimated_count=False):
+    """Return the changelist options that keep large tables fast.
+
+    Foreign keys shown in the list are joined in with list_select_related,
+    and no foreign key is edited through a select holding the whole related
+    table: models in `searchable_models` ("app.Model" labels whose generated
+    admin has search_fields, which Django's autocomplete checks require) get
+    an autocomplete, the others a raw id input. The changelist skips the
+    unfiltered COUNT(*). With estimated_count the remaining count comes from
+    Postgres' planner statistics for unfiltered changelists.
+    """
+    options = ["show_full_result_count = False"]
+    selected = [name for name, _ in relations if name in list_display]
+    if selected:
+        options.append(f"list_select_related = {format_fields(selected)}")
+    autocomplete = [name for name, model in relations if model in searchable_models]
+    raw_id = [name for name, model in relations if model not in searchable_models]
+    if autocomplete:
+        options.append(f"autocomplete_fields = {format_fields(autocomplete)}")
+    if raw_id:
+        options.append(f"raw_id_fields = {format_fields(raw_id)}")
+    if estimated_count:
+        options.append("paginator = EstimatedCountPaginator")
+    return "".join(f"    {option}\n" for option in options)
+
+def get_admin_template(blueprint, is_main_app=False, paginator_app=None, searchable_models=()):
+    """Generate admin.py content for an app's Blueprint.
+
+    `paginator_app` names the app holding paginators.py, whose estimated-count
+    paginator the changelist then uses. Foreign keys to `searchable_models`
+    are edited through autocompletes.
+    """
+    model_name = blueprint.model
+    options = get_model_admin_options(
+        blueprint.list_display, blueprint.relations, searchable_models, paginator_app is not None
+    )
+    list_display = format_fields(blueprint.list_display)
+    search_fields = format_fields(blueprint.search_fields)
+    list_filter = format_fields(blueprint.list_filter)
+    paginator_import = ""
+    if paginator_app is not None:
+        paginator_import = f"from {paginator_app}.paginators import EstimatedCountPaginator\n"
 
     if is_main_app:
         return f'''from django.contrib import admin
@@ -9,7 +54,7 @@ from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.admin import GroupAdmin as BaseGroupAdmin
 from django.contrib.auth.models import User, Group
 from .models import {model_name}
-from unfold.admin import ModelAdmin
+{paginator_import}from unfold.admin import ModelAdmin
 from unfold.forms import AdminPasswordChangeForm, UserChangeForm, UserCreationForm
 
 # Unregister default User and Group models
@@ -40,11 +85,11 @@ class {model_name}Admin(ModelAdmin):
     list_display = {list_display}
     search_fields = {search_fields}
     list_filter = {list_filter}
-'''
+{options}'''
     else:
         return f'''from django.contrib import admin
 from .models import {model_name}
-from unfold.admin import ModelAdmin
+{paginator_import}from unfold.admin import ModelAdmin
 
 # Unregister the model if already registered
 try:
@@ -57,4 +102,36 @@ class {model_name}Admin(ModelAdmin):
     list_display = {list_display}
     search_fields = {search_fields}
     list_filter = {list_filter}
-'''
\ No newline at end of file
+{options}'''
+
+def get_paginator_template():
+    """Generate paginators.py with a Postgres estimated-count paginator."""
+    return '''from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that trusts Postgres' row estimate for large unfiltered tables.
+
+    An exact COUNT(*) reads the whole table, so unfiltered querysets on
+    tables estimated above EXACT_BELOW rows use pg_class.reltuples instead.
+    Filtered querysets and small tables are still counted exactly.
+    """
+
+    EXACT_BELOW = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if hasattr(queryset, "query") and not queryset.query.where:
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= self.EXACT_BELOW:
+                return int(row[0])
+        return super().count
+'''
@@ -0,0 +1,190 @@
+"""App skeleton template generator for Django apps."""
+
+def get_app_config_name(app_name):
+    """Return the AppConfig class name Django's startapp would generate."""
+    return "".join(part for part in app_name.title() if part != "_") + "Config"
+
+def get_apps_template(app_name, is_main_app=False):
+    """Generate apps.py content for the app."""
+    content = f'''from django.apps import AppConfig
+
+
+class {get_app_config_name(app_name)}(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "{app_name}"
+'''
+    if is_main_app:
+        content += f'''
+    def ready(self):
+        from {app_name} import signals  # noqa: F401  Connects the list page invalidation
+'''
+    return content
+
+def get_tests_template(app_name, is_main_app=False):
+    """Generate tests.py content for the app."""
+    if is_main_app:
+        return f'''from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from clients.models import Client
+from orders.models import Order
+
+
+class IndexQueryCountTests(TestCase):
+    """The home page must not issue more queries as the tables grow."""
+
+    def create_orders(self, count):
+        start = Client.objects.count()
+        for i in range(start, start + count):
+            client = Client.objects.create(
+                first_name=f"First{{i}}",
+                last_name=f"Last{{i}}",
+                email=f"client{{i}}@example.com",
+                phone_number="555-0100",
+                address="1 Main Street",
+            )
+            Order.objects.create(
+                client=client,
+                delivery_date=timezone.now() + timedelta(days=7),
+                total_amount=Decimal("9.99"),
+                status="pending",
+            )
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_query_count_is_constant(self):
+        url = reverse("{app_name}:index")
+        self.create_orders(3)
+        few = self.count_queries(url)
+        self.create_orders(30)
+        self.assertEqual(self.count_queries(url), few)
+        self.assertEqual(self.count_queries(url + "?orders_page=2&clients_page=3"), few)
+'''
+    return '''from django.test import TestCase
+
+# Create your tests here.
+'''
+
+def get_benchmark_command_template(app_name):
+    """Generate a management command timing the home page's development overhead."""
+    return f'''import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+DEV_MIDDLEWARE = "django_browser_reload.middleware.BrowserReloadMiddleware"
+# The page cache would answer every timed request after the first one
+NO_CACHE = {{"default": {{"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}}}
+
+
+class Command(BaseCommand):
+    help = "Time the home page with and without the development-only middleware."
+
+    def add_arguments(self, parser):
+        parser.add_argument("-n", "--requests", type=int, default=200)
+
+    def time_requests(self, count, **overrides):
+        """Return the best mean ms/request of a few uncached rounds under the overrides."""
+        client = Client()
+        url = reverse("{app_name}:index")
+        rounds = []
+        with override_settings(CACHES=NO_CACHE, **overrides):
+            client.get(url)  # Warm up lazy imports
+            for _ in range(5):
+                start = time.perf_counter()
+                for _ in range(count):
+                    client.get(url)
+                rounds.append((time.perf_counter() - start) / count * 1000)
+        return min(rounds)
+
+    def handle(self, *args, **options):
+        count = options["requests"]
+        hosts = ["testserver", *settings.ALLOWED_HOSTS]
+        production = [item for item in settings.MIDDLEWARE if item != DEV_MIDDLEWARE]
+        if "django_browser_reload" not in settings.INSTALLED_APPS:
+            ms = self.time_requests(count, ALLOWED_HOSTS=hosts)
+            self.stdout.write(f"{{ms:.2f}} ms/request; django_browser_reload is not installed (DEBUG is off)")
+            return
+
+        # The middleware only runs with DEBUG on, so compare both with DEBUG on
+        with_dev = self.time_requests(
+            count, ALLOWED_HOSTS=hosts, DEBUG=True, MIDDLEWARE=[DEV_MIDDLEWARE, *production]
+        )
+        without_dev = self.time_requests(
+            count, ALLOWED_HOSTS=hosts, DEBUG=True, MIDDLEWARE=production
+        )
+        self.stdout.write(
+            f"With BrowserReloadMiddleware: {{with_dev:.2f}} ms/request\\n"
+            f"Without it: {{without_dev:.2f}} ms/request "
+            f"({{with_dev - without_dev:+.2f}} ms per request in development)"
+        )
+'''
+
+def get_warm_templates_command_template():
+    """Generate a management command compiling every project template up front."""
+    return '''import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.template import TemplateSyntaxError, engines
+from django.template.backends.django import DjangoTemplates
+
+
+def loader_dirs(loaders):
+    """Yield the directories every loader searches, looking inside cached loaders."""
+    for loader in loaders:
+        if hasattr(loader, "loaders"):
+            yield from loader_dirs(loader.loaders)
+        elif hasattr(loader, "get_dirs"):
+            yield from loader.get_dirs()
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile every template of this project into the cached template loader. "
+        "gunicorn.conf.py runs it in the master process, so workers fork warm."
+    )
+
+    def handle(self, *args, **options):
+        base_dir = Path(settings.BASE_DIR).resolve()
+        start = time.perf_counter()
+        compiled = 0
+        errors = []
+        for engine in engines.all():
+            if not isinstance(engine, DjangoTemplates):
+                continue
+            for directory in loader_dirs(engine.engine.template_loaders):
+                directory = Path(directory).resolve()
+                # Only the project's own templates, not those of installed packages
+                if not directory.is_dir() or not directory.is_relative_to(base_dir):
+                    continue
+                if "site-packages" in directory.parts:
+                    continue
+                for path in sorted(directory.rglob("*.html")):
+                    name = path.relative_to(directory).as_posix()
+                    try:
+                        engine.get_template(name)
+                    except TemplateSyntaxError as e:
+                        errors.append(f"{name}: {e}")
+                    else:
+                        compiled += 1
+
+        if errors:
+            raise CommandError("Templates failed to compile:\\n" + "\\n".join(errors))
+        elapsed = (time.perf_counter() - start) * 1000
+        self.stdout.write(f"Compiled {compiled} templates in {elapsed:.1f} ms")
+'''
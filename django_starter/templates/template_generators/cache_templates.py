@@ -0,0 +1,94 @@
+"""Page cache template generators for the main app."""
+
+def get_cache_helpers_template():
+    """Generate cache.py content: the list page cache and its invalidation."""
+    return '''import uuid
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import add_never_cache_headers
+from django.views.decorators.cache import cache_page
+
+# Every cached list page is keyed under the current version, so replacing
+# the version drops them all at once; the old entries simply expire.
+VERSION_KEY = "list-pages-version"
+
+
+def list_pages_version():
+    return cache.get_or_set(VERSION_KEY, lambda: uuid.uuid4().hex, None)
+
+
+def invalidate_list_pages():
+    cache.set(VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def server_cache_page(timeout, key_prefix=None):
+    """cache_page that keeps pages in the server's cache only.
+
+    cache_page also sends Cache-Control: max-age=<timeout>, and browsers or
+    proxies holding a page that way can't be told it was invalidated here.
+    """
+    def decorator(view):
+        if not timeout:
+            return view
+        cached_view = cache_page(timeout, key_prefix=key_prefix)(view)
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            response = cached_view(request, *args, **kwargs)
+            add_never_cache_headers(response)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def cache_list_page(view):
+    """Server-side page cache for views listing models, dropped whenever those change."""
+    if not settings.CACHE_TTL:
+        return view
+    cached_views = {}  # The view cached under the current version only
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        version = list_pages_version()
+        cached_view = cached_views.get(version)
+        if cached_view is None:
+            cached_view = server_cache_page(settings.CACHE_TTL, key_prefix=f"list-pages-{version}")(view)
+            cached_views.clear()
+            cached_views[version] = cached_view
+        return cached_view(request, *args, **kwargs)
+
+    return wrapper
+'''
+
+def get_signals_template(app_name):
+    """Generate signals.py content invalidating the list pages on model changes."""
+    return f'''from django.db.models.signals import post_delete, post_save
+
+from {app_name}.cache import invalidate_list_pages
+
+# Models shown on cached list pages
+LISTED_MODELS = ("clients.Client", "orders.Order")
+
+
+def drop_list_pages(sender, **kwargs):
+    invalidate_list_pages()
+
+
+for model in LISTED_MODELS:
+    post_save.connect(drop_list_pages, sender=model, dispatch_uid=f"{{model}}-saved")
+    post_delete.connect(drop_list_pages, sender=model, dispatch_uid=f"{{model}}-deleted")
+'''
+
+def get_context_processors_template():
+    """Generate context_processors.py content exposing CACHE_TTL to templates."""
+    return '''from django.conf import settings
+
+
+def cache_ttl(request):
+    """Let {% cache CACHE_TTL ... %} fragments follow the page cache lifetime."""
+    return {"CACHE_TTL": settings.CACHE_TTL}
+'''
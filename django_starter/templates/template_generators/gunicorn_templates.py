@@ -0,0 +1,74 @@
+"""Gunicorn configuration template generator."""
+
+WORKER_CLASSES = ("sync", "gthread", "uvicorn")
+
+def get_gunicorn_config_template(project_name, worker_class="gthread"):
+    """Generate gunicorn.conf.py content for the project."""
+    return f'''"""Gunicorn configuration for {project_name}.
+
+Gunicorn reads this file when started from this directory:
+
+    gunicorn
+
+Worker processes and threads follow the CPUs available to this process.
+GUNICORN_WORKER_CLASS (sync, gthread or uvicorn), GUNICORN_WORKERS,
+GUNICORN_THREADS and GUNICORN_BIND override the defaults.
+"""
+
+import multiprocessing
+import os
+
+
+def available_cpus():
+    try:
+        return len(os.sched_getaffinity(0))  # Honours container CPU limits
+    except AttributeError:
+        return multiprocessing.cpu_count()
+
+
+cpus = available_cpus()
+mode = os.environ.get("GUNICORN_WORKER_CLASS", "{worker_class}")
+
+if mode == "sync":
+    # One request per process: the classic 2 * CPUs + 1
+    wsgi_app = "{project_name}.wsgi:application"
+    default_workers, default_threads = 2 * cpus + 1, 1
+elif mode == "gthread":
+    # Fewer processes, each serving several requests from a thread pool
+    worker_class = "gthread"
+    wsgi_app = "{project_name}.wsgi:application"
+    default_workers, default_threads = cpus + 1, 4
+elif mode == "uvicorn":
+    # Event loop per process running the ASGI application
+    worker_class = "uvicorn_worker.UvicornWorker"
+    wsgi_app = "{project_name}.asgi:application"
+    default_workers, default_threads = cpus, 1
+else:
+    raise ValueError(f"Unknown GUNICORN_WORKER_CLASS: {{mode}}")
+
+workers = int(os.environ.get("GUNICORN_WORKERS", default_workers))
+threads = int(os.environ.get("GUNICORN_THREADS", default_threads))
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# Recycle workers now and then to contain slow leaks, staggered so they
+# never all restart at once
+max_requests = 1000
+max_requests_jitter = 100
+
+# Import Django once in the master so workers fork with it loaded
+preload_app = True
+
+
+def when_ready(server):
+    # Runs in the master after the preload, so every worker inherits the
+    # compiled templates instead of compiling them on its first requests
+    from django.core.management import call_command
+
+    call_command("warm_templates")
+
+
+keepalive = 5
+timeout = 30
+graceful_timeout = 30
+accesslog = "-"
+'''
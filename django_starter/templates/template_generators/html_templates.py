@@ -44,6 +44,50 @@ def get_main_index_template():
         </div>
     </div>
 
+    <!-- Latest Orders and Clients -->
+    <div class="grid grid-cols-1 md:grid-cols-2 gap-6 mb-8">
+        <div class="bg-white rounded-lg shadow-md p-6">
+            <h2 class="text-xl font-semibold text-gray-800 mb-4">Latest Orders</h2>
+            <ul class="divide-y divide-gray-200">
+                {% for order in orders %}
+                <li class="py-2 flex justify-between text-gray-600">
+                    <span>{{ order }}</span>
+                    <span>{{ order.status }} &middot; {{ order.total_amount }}</span>
+                </li>
+                {% empty %}
+                <li class="py-2 text-gray-500">No orders yet.</li>
+                {% endfor %}
+            </ul>
+            {% if orders.has_other_pages %}
+            <div class="flex justify-between mt-4 text-sm">
+                {% if orders.has_previous %}<a href="?orders_page={{ orders.previous_page_number }}" class="text-blue-500">Previous</a>{% else %}<span></span>{% endif %}
+                <span class="text-gray-500">Page {{ orders.number }} of {{ orders.paginator.num_pages }}</span>
+                {% if orders.has_next %}<a href="?orders_page={{ orders.next_page_number }}" class="text-blue-500">Next</a>{% else %}<span></span>{% endif %}
+            </div>
+            {% endif %}
+        </div>
+        <div class="bg-white rounded-lg shadow-md p-6">
+            <h2 class="text-xl font-semibold text-gray-800 mb-4">Clients</h2>
+            <ul class="divide-y divide-gray-200">
+                {% for client in clients %}
+                <li class="py-2 flex justify-between text-gray-600">
+                    <span>{{ client }}</span>
+                    <span>{{ client.email }}</span>
+                </li>
+                {% empty %}
+                <li class="py-2 text-gray-500">No clients yet.</li>
+                {% endfor %}
+            </ul>
+            {% if clients.has_other_pages %}
+            <div class="flex justify-between mt-4 text-sm">
+                {% if clients.has_previous %}<a href="?clients_page={{ clients.previous_page_number }}" class="text-blue-500">Previous</a>{% else %}<span></span>{% endif %}
+                <span class="text-gray-500">Page {{ clients.number }} of {{ clients.paginator.num_pages }}</span>
+                {% if clients.has_next %}<a href="?clients_page={{ clients.next_page_number }}" class="text-blue-500">Next</a>{% else %}<span></span>{% endif %}
+            </div>
+            {% endif %}
+        </div>
+    </div>
+
     <!-- CTA Section -->
     <div class="bg-blue-50 rounded-lg shadow-md p-8 text-center">
         <h2 class="text-2xl font-bold text-gray-800 mb-4">Start Building Today</h2>
@@ -1,47 +1,114 @@
 """Model template generator for Django apps."""
 
-def get_models_template(app_name):
-    """Generate models.py content for the app."""
-    if app_name == "clients":
-        return '''from django.db import models
-
-class Client(models.Model):
-    first_name = models.CharField(max_length=100)
-    last_name = models.CharField(max_length=100)
-    email = models.EmailField(unique=True)
-    phone_number = models.CharField(max_length=15)
-    address = models.TextField()
+import hashlib
 
-    def __str__(self):
-        return f"{self.first_name} {self.last_name}"
-'''
-    elif app_name == "orders":
-        return '''from django.db import models
-from clients.models import Client
+def _index_name(model_name, fields, kind="idx"):
+    """Return a readable index name within Django's 30 character limit."""
+    readable = "_".join([model_name.lower()] + [field.lstrip("-") for field in fields])
+    digest = hashlib.md5(f"{readable}:{kind}".encode()).hexdigest()[:4]
+    return f"{readable[:21]}_{digest}_{kind[:3]}"
 
-class Order(models.Model):
-    client = models.ForeignKey(Client, on_delete=models.CASCADE)
-    order_date = models.DateTimeField(auto_now_add=True)
-    delivery_date = models.DateTimeField()
-    total_amount = models.DecimalField(max_digits=10, decimal_places=2)
-    status = models.CharField(max_length=50)
+def _local_fields(fields):
+    """Drop lookups through relations and admin search prefixes such as "^"."""
+    return [field for field in fields if "__" not in field and field[0] not in "^=@"]
 
-    def __str__(self):
-        return f"Order {self.id} for {self.client}"
-'''
-    else:
-        return f'''from django.db import models
+def get_model_indexes(model_name, list_filter=(), search_fields=(), ordering=(),
+                      unique_fields=(), postgres=False):
+    """Derive Meta.indexes from the columns the admin filters, sorts and searches.
+
+    The default ordering gets its own index, and every other filtered column
+    a composite index with the ordering appended, so a filtered changelist is
+    read in order without a sort. Postgres also gets trigram GIN indexes on
+    UPPER(column), the expression the admin's icontains searches compare.
+    """
+    indexes = []
+    if ordering:
+        indexes.append(
+            f'models.Index(fields={list(ordering)!r}, name="{_index_name(model_name, ordering)}")'
+        )
+
+    leading_sort = ordering[0].lstrip("-") if ordering else None
+    for field in _local_fields(list_filter):
+        # Unique columns are indexed already, the leading sort column above
+        if field in unique_fields or field == leading_sort:
+            continue
+        fields = [field] + [f for f in ordering if f.lstrip("-") != field]
+        indexes.append(
+            f'models.Index(fields={fields!r}, name="{_index_name(model_name, fields)}")'
+        )
+
+    if postgres:
+        for field in _local_fields(search_fields):
+            indexes.append(
+                f'GinIndex(OpClass(Upper("{field}"), name="gin_trgm_ops"), '
+                f'name="{_index_name(model_name, [field], "trgm")}")'
+            )
+    return [index.replace("'", '"') for index in indexes]
 
-class {app_name.capitalize()}Item(models.Model):
-    title = models.CharField(max_length=200)
-    description = models.TextField()
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+def _get_meta_template(ordering=(), indexes=(), extra=()):
+    """Render a Meta class body, or nothing when there is nothing to set."""
+    lines = list(extra)
+    if ordering:
+        lines.append(f"ordering = {list(ordering)!r}".replace("'", '"'))
+    if indexes:
+        lines.append("indexes = [")
+        lines.extend(f"    {index}," for index in indexes)
+        lines.append("]")
+    if not lines:
+        return ""
+    body = "".join(f"        {line}\n" for line in lines)
+    return f"\n    class Meta:\n{body}"
 
+def _get_imports(indexes, extra=()):
+    """Return the import lines the model module needs."""
+    imports = []
+    if any(index.startswith("GinIndex(") for index in indexes):
+        imports += [
+            "from django.contrib.postgres.indexes import GinIndex, OpClass",
+            "from django.db.models.functions import Upper",
+        ]
+    return "\n".join(["from django.db import models", *imports, *extra]) + "\n"
+
+def get_models_template(blueprint, postgres=False):
+    """Generate models.py content for an app's Blueprint.
+
+    The admin's list_filter, search_fields and default ordering decide which
+    indexes are declared.
+    """
+    indexes = get_model_indexes(
+        blueprint.model,
+        blueprint.list_filter,
+        blueprint.search_fields,
+        blueprint.ordering,
+        unique_fields=blueprint.unique_fields,
+        postgres=postgres,
+    )
+    fields = [
+        f'{name} = models.ForeignKey("{target}", on_delete=models.CASCADE)'
+        for name, target in blueprint.relations
+    ]
+    fields += [f"{name} = {declaration}" for name, declaration in blueprint.fields]
+    meta = []
+    if blueprint.verbose_name:
+        meta.append(f'verbose_name = "{blueprint.verbose_name}"')
+    if blueprint.verbose_name_plural:
+        meta.append(f'verbose_name_plural = "{blueprint.verbose_name_plural}"')
+
+    body = "".join(f"    {field}\n" for field in fields)
+    return _get_imports(indexes) + f'''
+class {blueprint.model}(models.Model):
+{body}
     def __str__(self):
-        return self.title
+        return {blueprint.str_expression}
+{_get_meta_template(blueprint.ordering, indexes, meta)}'''
 
-    class Meta:
-        verbose_name = "{app_name.capitalize()} Item"
-        verbose_name_plural = "{app_name.capitalize()} Items"
-'''
\ No newline at end of file
+def get_trigram_migration_template():
+    """Generate the migration enabling pg_trgm ahead of an app's initial one."""
+    return '''from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # The trigram indexes on the admin's search fields need pg_trgm
+    operations = [TrigramExtension()]
+'''
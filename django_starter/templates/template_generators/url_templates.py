@@ -11,4 +11,29 @@ urlpatterns = [
     path("", views.index, name="index"),
     path("about/", views.about, name="about"),
 ]
-'''
\ No newline at end of file
+'''
+
+def get_project_urls_template(apps, main_app="home"):
+    """Generate the project's urls.py.
+
+    The main app (settings.HOME_APP) is served at the root and every other
+    app under its own prefix. django_browser_reload is only mounted while
+    settings keeps it installed, i.e. while DEBUG is on.
+    """
+    app_patterns = "".join(
+        f'    path("{app}/", include("{app}.urls", namespace="{app}")),\n'
+        for app in apps
+        if app != main_app
+    )
+    return f'''from django.conf import settings
+from django.contrib import admin
+from django.urls import include, path
+
+urlpatterns = [
+    path("admin/", admin.site.urls),
+    path("", include(f"{{settings.HOME_APP}}.urls")),  # Main app as homepage
+{app_patterns}]
+
+if "django_browser_reload" in settings.INSTALLED_APPS:
+    urlpatterns.append(path("__reload__/", include("django_browser_reload.urls")))
+'''
@@ -1,23 +1,39 @@
 """View template generator for Django apps."""
 
-def get_views_template(app_name, project_name, is_main_app=False):
-    """Generate views.py content for the app."""
+def get_views_template(app_name, project_name, is_main_app=False, main_app="home"):
+    """Generate views.py content for the app.
+
+    Pages are cached with the main app's server_cache_page helpers.
+    """
     if is_main_app:
-        return f'''from django.shortcuts import render
+        return f'''from django.conf import settings
+from django.core.paginator import Paginator
+from django.shortcuts import render
 from clients.models import Client
 from orders.models import Order
+from {app_name}.cache import cache_list_page, server_cache_page
+
+PAGE_SIZE = 10
 
+@cache_list_page
 def index(request):
-    clients = Client.objects.all()
-    orders = Order.objects.all()
+    # Only the columns the page shows, with each order's client joined in,
+    # so the query count stays the same however many rows there are
+    clients = Client.objects.only("first_name", "last_name", "email").order_by("last_name", "id")
+    orders = (
+        Order.objects.select_related("client")
+        .only("order_date", "total_amount", "status", "client__first_name", "client__last_name")
+        .order_by("-order_date", "-id")
+    )
     context = {{
         "title": "Welcome to {project_name.capitalize()}",
         "project_name": "{project_name}",
-        "clients": clients,
-        "orders": orders
+        "clients": Paginator(clients, PAGE_SIZE).get_page(request.GET.get("clients_page")),
+        "orders": Paginator(orders, PAGE_SIZE).get_page(request.GET.get("orders_page")),
     }}
     return render(request, "{app_name}/index.html", context)
 
+@server_cache_page(settings.CACHE_TTL)
 def about(request):
     context = {{
         "title": "About {app_name.capitalize()}",
@@ -26,8 +42,11 @@ def about(request):
     return render(request, "{app_name}/about.html", context)
 '''
     else:
-        return f'''from django.shortcuts import render
+        return f'''from django.conf import settings
+from django.shortcuts import render
+from {main_app}.cache import server_cache_page
 
+@server_cache_page(settings.CACHE_TTL)
 def index(request):
     context = {{
         "title": "{app_name.capitalize()} Home",
@@ -35,6 +54,7 @@ def index(request):
     }}
     return render(request, "{app_name}/index.html", context)
 
+@server_cache_page(settings.CACHE_TTL)
 def about(request):
     context = {{
         "title": "About {app_name.capitalize()}",
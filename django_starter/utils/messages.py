@@ -33,6 +33,9 @@ Your project is ready! Next steps:
 2. In a separate terminal, start Tailwind development server:
    python manage.py tailwind start
 
+3. Serve it with gunicorn, configured in gunicorn.conf.py:
+   gunicorn
+
 Your project is ready at: {base_dir}
 Created apps: {', '.join(created_apps) if created_apps else 'None'}
 
@@ -0,0 +1,67 @@
+# File: django_starter/utils/project_files.py
+
+import os
+from collections import defaultdict
+from pathlib import Path
+from ..core.run_report import count_written
+
+
+class ProjectFiles:
+    """In-memory staging area for generated files, written in one batch.
+
+    Generators stage (path, content) pairs relative to `root` and nothing
+    touches the disk until commit(). That creates each directory once and
+    skips every file whose content is already on disk, so regenerating an
+    unchanged file costs a stat and a read instead of a rewrite.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._files = {}
+
+    def stage(self, relative_path, content):
+        """Stage a file; staging the same path again replaces its content."""
+        self._files[str(relative_path)] = content.encode()
+
+    def stage_all(self, files, prefix=""):
+        """Stage (relative path, content) pairs, optionally below `prefix`."""
+        for relative_path, content in files:
+            self.stage(os.path.join(prefix, relative_path), content)
+
+    def __len__(self):
+        return len(self._files)
+
+    def commit(self):
+        """Write the staged files and return the paths that changed."""
+        directories = defaultdict(list)
+        for relative_path, data in self._files.items():
+            path = self.root / relative_path
+            directories[path.parent].append((path, data))
+        self._files = {}
+
+        written = []
+        for directory, files in directories.items():
+            directory.mkdir(parents=True, exist_ok=True)
+            for path, data in files:
+                if self._unchanged(path, data):
+                    continue
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                count_written(path, len(data))
+                written.append(path)
+        return written
+
+    @staticmethod
+    def _unchanged(path, data):
+        try:
+            if os.stat(path).st_size != len(data):
+                return False
+        except FileNotFoundError:
+            return False
+        with open(path, "rb") as file:
+            return file.read() == data
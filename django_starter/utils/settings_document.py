@@ -0,0 +1,180 @@
+# File: django_starter/utils/settings_document.py
+
+import os
+import re
+import threading
+from collections import defaultdict
+from functools import wraps
+from pathlib import Path
+from ..core.run_report import count_written
+
+ASSIGNMENT_RE = re.compile(r"^([A-Z][A-Z0-9_]*)\s*=")
+LIST_ITEM_RE = re.compile(r"""^\s*['"]([^'"]+)['"]""")
+
+
+def _locked(method):
+    """Serialize access to the document across pipeline threads."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class SettingsDocument:
+    """In-memory settings.py shared by every installer.
+
+    The file is read and indexed once. Edits are queued against the indexed
+    anchors and applied in a single pass when the document is flushed, so
+    installers never re-read the file or shift each other's line numbers.
+    The document is safe to share between pipeline threads.
+    """
+
+    ANCHORS = {
+        "INSTALLED_APPS": "INSTALLED_APPS = [",
+        "MIDDLEWARE": "MIDDLEWARE = [",
+        "ROOT_URLCONF": "ROOT_URLCONF = ",
+        "STATIC_URL": "STATIC_URL = ",
+        "I18N": "# Internationalization",
+    }
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        with open(self.path, "r") as file:
+            self._index(file.readlines())
+
+    def _index(self, lines):
+        """Index anchors, list bounds and top-level assignments."""
+        self._lines = lines
+        self._anchors = {}
+        self._list_ends = {}
+        self._list_items = {}
+        self._list_lines = {}
+        self._assignments = {}
+
+        for i, line in enumerate(lines):
+            for name, marker in self.ANCHORS.items():
+                if name not in self._anchors and marker in line:
+                    self._anchors[name] = i
+            match = ASSIGNMENT_RE.match(line)
+            if match and match.group(1) not in self._assignments:
+                self._assignments[match.group(1)] = i
+
+        for name in ("INSTALLED_APPS", "MIDDLEWARE"):
+            if name not in self._anchors:
+                continue
+            end = self._anchors[name] + 1
+            items = set()
+            item_lines = {}
+            while end < len(lines) and not lines[end].strip().startswith("]"):
+                match = LIST_ITEM_RE.match(lines[end])
+                if match:
+                    items.add(match.group(1))
+                    item_lines[match.group(1)] = end
+                end += 1
+            self._list_ends[name] = end
+            self._list_items[name] = items
+            self._list_lines[name] = item_lines
+
+        self._before = defaultdict(list)
+        self._after = defaultdict(list)
+        self._replaced = {}
+        self._prepended = []
+        self._appended = []
+        self._dirty = False
+
+    def _anchor(self, name):
+        if name not in self._anchors:
+            raise Exception(f"Could not find {self.ANCHORS[name]!r} in {self.path}")
+        return self._anchors[name]
+
+    def _add_to_list(self, name, items, line_format, first, after=None):
+        self._anchor(name)
+        new_items = [item for item in items if item not in self._list_items[name]]
+        if not new_items:
+            return
+        self._list_items[name].update(new_items)
+        lines = [line_format.format(item) for item in new_items]
+        if after is not None and after in self._list_lines[name]:
+            self._after[self._list_lines[name][after]].extend(lines)
+        elif first:
+            # Later blocks go above earlier ones, like inserting right after "[".
+            start = self._anchors[name]
+            self._after[start] = lines + self._after[start]
+        else:
+            self._before[self._list_ends[name]].extend(lines)
+        self._dirty = True
+
+    @_locked
+    def add_installed_apps(self, apps, first=False):
+        """Add apps to INSTALLED_APPS, at the top if `first` is set."""
+        self._add_to_list("INSTALLED_APPS", apps, "    '{}',\n", first)
+
+    @_locked
+    def add_middleware(self, middleware, first=False, after=None):
+        """Add middleware classes to MIDDLEWARE, at the top if `first` is set.
+
+        With `after`, they go right below that middleware when the file
+        lists it, and fall back to `first` otherwise.
+        """
+        self._add_to_list("MIDDLEWARE", middleware, '    "{}",\n', first, after)
+
+    @_locked
+    def set(self, name, value, after=None):
+        """Assign `name = value`, replacing an existing single-line assignment.
+
+        New settings are placed after the `after` anchor when given and
+        appended to the end of the file otherwise.
+        """
+        line = f"{name} = {value}\n"
+        self._dirty = True
+        if name in self._assignments:
+            index = self._assignments[name]
+            self._replaced[index] = line
+        elif after is not None:
+            self._after[self._anchor(after)].append(line)
+        else:
+            self._appended.append(line)
+
+    @_locked
+    def ensure_import(self, statement):
+        """Add an import statement at the top of the file if it is missing."""
+        line = f"{statement}\n"
+        if line in self._lines or line in self._prepended:
+            return
+        self._prepended.append(line)
+        self._dirty = True
+
+    @_locked
+    def append(self, lines):
+        """Append raw lines to the end of the file."""
+        self._appended.extend(lines)
+        self._dirty = True
+
+    @_locked
+    def render(self):
+        """Return the document with every queued edit applied."""
+        output = list(self._prepended)
+        for i, line in enumerate(self._lines):
+            output.extend(self._before.get(i, ()))
+            output.append(self._replaced.get(i, line))
+            output.extend(self._after.get(i, ()))
+        output.extend(self._before.get(len(self._lines), ()))
+        output.extend(self._appended)
+        return "".join(output)
+
+    @_locked
+    def flush(self):
+        """Write pending edits to disk in one write."""
+        if not self._dirty:
+            return
+        content = self.render()
+        # Replace atomically so a manage.py subprocess started by another
+        # step never reads a half-written file.
+        temp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with open(temp_path, "w") as file:
+            file.write(content)
+        os.replace(temp_path, self.path)
+        count_written(self.path, len(content.encode()))
+        self._index(content.splitlines(keepends=True))
@@ -0,0 +1,113 @@
+# File: django_starter/utils/source_editor.py
+
+import ast
+import os
+from pathlib import Path
+from ..core.run_report import count_written
+
+
+class SourceEditor:
+    """Add elements to module-level lists of a Python file users may have edited.
+
+    The file is parsed with ast to find `NAME = [...]` and new elements are
+    spliced in before its closing bracket. Everything else, including
+    comments, formatting and elements added by hand, is left untouched.
+    Elements equal to one already in the list are skipped.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "r") as file:
+            self._source = file.read()
+        self._dirty = False
+
+    def _find_list(self, name):
+        """Return the ast.List assigned to `name` at module level."""
+        for node in ast.parse(self._source, filename=str(self.path)).body:
+            if isinstance(node, ast.Assign):
+                targets = node.targets
+            elif isinstance(node, ast.AnnAssign) and node.value is not None:
+                targets = [node.target]
+            else:
+                continue
+            if any(isinstance(target, ast.Name) and target.id == name for target in targets):
+                if not isinstance(node.value, ast.List):
+                    raise Exception(f"{name} in {self.path} is not a list literal")
+                return node.value
+        raise Exception(f"Could not find {name} = [...] in {self.path}")
+
+    def _offset(self, lineno, col_offset):
+        """Turn an ast (line, UTF-8 column) position into a string index."""
+        lines = self._source.splitlines(keepends=True)
+        start = sum(len(line) for line in lines[:lineno - 1])
+        return start + len(lines[lineno - 1].encode()[:col_offset].decode())
+
+    def list_elements(self, name):
+        """Return the source of every element of the list."""
+        return [ast.get_source_segment(self._source, element) for element in self._find_list(name).elts]
+
+    def add_strings(self, name, values):
+        """Add string elements, quoted like the strings already in the list."""
+        quote = "'"
+        for element in self.list_elements(name):
+            if element[:1] in "'\"":
+                quote = element[0]
+                break
+        self.add_to_list(name, [f"{quote}{value}{quote}" for value in values])
+
+    def add_to_list(self, name, expressions):
+        """Append source expressions to the list, skipping ones it holds already."""
+        node = self._find_list(name)
+        existing = {ast.dump(element) for element in node.elts}
+        new = []
+        for expression in expressions:
+            key = ast.dump(ast.parse(expression, mode="eval").body)
+            if key not in existing:
+                existing.add(key)
+                new.append(expression)
+        if not new:
+            return
+
+        close = self._offset(node.end_lineno, node.end_col_offset) - 1
+        if node.elts:
+            last = node.elts[-1]
+            last_end = self._offset(last.end_lineno, last.end_col_offset)
+        else:
+            last_end = self._offset(node.lineno, node.col_offset) + 1
+        line_start = self._source.rfind("\n", 0, close) + 1
+
+        if node.lineno == node.end_lineno or self._source[line_start:close].strip():
+            # `[a, b]` or elements sharing the closing bracket's line
+            separator = ", " if node.elts else ""
+            insert = separator + ", ".join(new)
+            self._source = self._source[:last_end] + insert + self._source[last_end:]
+        else:
+            if node.elts:
+                indent = " " * node.elts[0].col_offset
+                if "," not in self._strip_comments(self._source[last_end:close]):
+                    self._source = self._source[:last_end] + "," + self._source[last_end:]
+                    line_start += 1
+            else:
+                opening_line = self._source.splitlines()[node.lineno - 1]
+                indent = opening_line[:len(opening_line) - len(opening_line.lstrip())] + "    "
+            insert = "".join(f"{indent}{expression},\n" for expression in new)
+            self._source = self._source[:line_start] + insert + self._source[line_start:]
+        self._dirty = True
+
+    @staticmethod
+    def _strip_comments(text):
+        return "".join(line.split("#", 1)[0] for line in text.splitlines(keepends=True))
+
+    def render(self):
+        return self._source
+
+    def flush(self):
+        """Write the edited file, replacing it atomically."""
+        if not self._dirty:
+            return
+        temp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with open(temp_path, "w") as file:
+            file.write(self._source)
+        os.replace(temp_path, self.path)
+        count_written(self.path, len(self._source.encode()))
+        self._dirty = False
@@ -1,47 +1,91 @@
-import sys
-import subprocess
+import difflib
+from functools import lru_cache
 from pathlib import Path
 
-try:
-    from pick import pick
-except ImportError:
-    print("Installing required package: pick...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "pick"])
-    try:
-        from pick import pick
-    except ImportError:
-        print("Failed to install pick. Please install it manually.")
-        sys.exit(1)
+TIMEZONE_DATA = Path(__file__).parent / 'timezone_data.txt'
+REGIONS = ('Africa', 'America', 'Asia', 'Atlantic', 'Australia', 'Europe', 'Indian', 'Pacific')
+
+
+@lru_cache(maxsize=None)
+def load_timezone_index():
+    """Parse timezone_data.txt once into a region -> sorted timezones index."""
+    # Using a curated list of timezones from the provided data
+    index = {region: set() for region in REGIONS}
+    with open(TIMEZONE_DATA, 'r') as f:
+        for line in f:
+            parts = line.split('|')
+            if len(parts) >= 4:
+                timezone = parts[3].strip()
+                region = timezone.split('/', 1)[0]
+                if region in index:  # Also skips the header row
+                    index[region].add(timezone)
+    return {region: tuple(sorted(zones)) for region, zones in index.items()}
+
+
+@lru_cache(maxsize=None)
+def _search_keys():
+    """Map lowercase search keys (full name and city) to timezones."""
+    keys = {}
+    for zones in load_timezone_index().values():
+        for timezone in zones:
+            city = timezone.rsplit('/', 1)[-1]
+            for key in (timezone.lower(), city.lower(), city.replace('_', ' ').lower()):
+                keys.setdefault(key, timezone)
+    return keys
+
+
+def search_timezones(query, limit=20):
+    """Find timezones by prefix, then substring, then fuzzy match on the city."""
+    query = query.strip().lower().replace(' ', '_')
+    if not query:
+        return []
+
+    keys = _search_keys()
+    matches = []
+    for matcher in (str.startswith, str.__contains__):
+        for key, timezone in keys.items():
+            if matcher(key, query) and timezone not in matches:
+                matches.append(timezone)
+    if not matches:
+        for key in difflib.get_close_matches(query, keys, n=limit, cutoff=0.6):
+            if keys[key] not in matches:
+                matches.append(keys[key])
+    return matches[:limit]
+
 
 class TimezoneSelector:
-    def __init__(self):
-        self.regions = {
-            'Africa': [tz for tz in self._get_all_timezones() if tz.startswith('Africa/')],
-            'America': [tz for tz in self._get_all_timezones() if tz.startswith('America/')],
-            'Asia': [tz for tz in self._get_all_timezones() if tz.startswith('Asia/')],
-            'Atlantic': [tz for tz in self._get_all_timezones() if tz.startswith('Atlantic/')],
-            'Australia': [tz for tz in self._get_all_timezones() if tz.startswith('Australia/')],
-            'Europe': [tz for tz in self._get_all_timezones() if tz.startswith('Europe/')],
-            'Indian': [tz for tz in self._get_all_timezones() if tz.startswith('Indian/')],
-            'Pacific': [tz for tz in self._get_all_timezones() if tz.startswith('Pacific/')],
-        }
+    REQUIREMENTS = ["pick"]
+
+    @property
+    def regions(self):
+        return load_timezone_index()
 
     def _get_all_timezones(self):
         """Get list of all available timezones."""
-        # Using a curated list of timezones from the provided data
-        timezones = []
-        with open(Path(__file__).parent / 'timezone_data.txt', 'r') as f:
-            for line in f:
-                if '|' in line:
-                    parts = line.split('|')
-                    if len(parts) >= 4:
-                        timezone = parts[3].strip()
-                        if timezone != 'Timezone Identifier':  # Skip header
-                            timezones.append(timezone)
-        return sorted(list(set(timezones)))
+        return sorted(tz for zones in self.regions.values() for tz in zones)
+
+    def is_valid(self, timezone):
+        """Check a timezone given without the menus, e.g. from a config file."""
+        return timezone == "UTC" or timezone in self.regions.get(timezone.split('/', 1)[0], ())
 
     def select_timezone(self):
         """Interactive timezone selection using arrow keys."""
+        # Imported here: pick is installed by the dependency stage, which runs
+        # after this module has been imported.
+        from pick import pick
+
+        # Let a typed filter short-cut the menus
+        query = input("\nType part of your timezone (e.g. vienna), or press Enter to browse: ")
+        if query.strip():
+            matches = search_timezones(query)
+            if len(matches) == 1:
+                return matches[0]
+            if matches:
+                title = f'Timezones matching "{query.strip()}" (press ENTER to select):'
+                timezone, _ = pick(matches, title)
+                return timezone
+            print(f'No timezone matches "{query.strip()}", browsing by region instead.')
+
         # First select region
         title = 'Please choose your region (press ENTER to select):'
         region_options = sorted(self.regions.keys())
@@ -49,21 +93,11 @@ class TimezoneSelector:
 
         # Then select specific timezone
         title = f'Please choose your timezone in {region} (press ENTER to select):'
-        timezone_options = sorted(self.regions[region])
+        timezone_options = list(self.regions[region])
         timezone, _ = pick(timezone_options, title)
 
         return timezone
 
-    def update_settings(self, project_name, timezone):
-        """Update Django settings.py with selected timezone."""
-        settings_path = Path.cwd() / project_name / "settings.py"
-        with open(settings_path, "r") as file:
-            content = file.readlines()
-
-        for i, line in enumerate(content):
-            if line.startswith('TIME_ZONE = '):
-                content[i] = f'TIME_ZONE = "{timezone}"\n'
-                break
-
-        with open(settings_path, "w") as file:
-            file.writelines(content)
\ No newline at end of file
+    def update_settings(self, settings, timezone):
+        """Set the selected timezone on the project's settings document."""
+        settings.set("TIME_ZONE", f'"{timezone}"', after="I18N")
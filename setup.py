@@ -4,6 +4,9 @@ setup(
     name="django-starter",
     version="1.0.0",
     packages=find_packages(),
+    package_data={
+        "django_starter": ["utils/timezone_data.txt", "templates/blueprints.toml"],
+    },
     python_requires=">=3.8",
     install_requires=[
         "django",
@@ -12,12 +15,14 @@ setup(
         "django-unfold",
         "pick",  # Changed from python-inquirer to pick
         "python-dotenv",
-        "whitenoise",
+        "whitenoise[brotli]",
         "pillow",
         "psycopg2-binary",
         "gunicorn",
         "requests",
         "rich",
+        "packaging",  # Version checks before installing requirements
+        "tomli; python_version < '3.11'",
     ],
     entry_points={
         "console_scripts": [
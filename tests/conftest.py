@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def chdir(tmp_path):
+    """Run the test inside tmp_path; installers work relative to the cwd."""
+    previous = os.getcwd()
+    os.chdir(tmp_path)
+    yield tmp_path
+    os.chdir(previous)
+
+
+@pytest.fixture
+def build_project(chdir):
+    """Build a project in tmp_path with the steps that generate Python code.
+
+    Tailwind, npm, collectstatic and the production settings are left out.
+    The project gets the manifest a full build writes.
+
+    Returns a function taking the project name and builder options, which
+    returns the project directory.
+    """
+    pytest.importorskip("django")
+    pytest.importorskip("unfold")
+    from django_starter.core.cache_installer import CacheInstaller
+    from django_starter.core.django_installer import DjangoInstaller
+    from django_starter.core.gunicorn_config import GunicornConfig
+    from django_starter.core.project_updater import ProjectManifest, generated_files
+    from django_starter.core.unfold_installer import UnfoldInstaller
+    from django_starter.templates.app_template_creator import AppTemplateCreator
+    from django_starter.templates.base_template_creator import BaseTemplateCreator
+
+    def build(name="acme", apps=(), blueprints=None):
+        django_installer = DjangoInstaller()
+        django_installer.get_project_name(name)
+        django_installer.create_django_project(chdir, timezone="UTC")
+        settings = django_installer.settings
+        app_creator = AppTemplateCreator(name, settings=settings, blueprints=blueprints)
+        app_creator.set_additional_apps(list(apps))
+        django_installer.apps = app_creator.created_apps
+        template_creator = BaseTemplateCreator(name)
+        template_creator.create_base_templates()
+        app_creator.create_apps()
+        UnfoldInstaller(name, settings=settings).update_settings()
+        CacheInstaller(name, settings, main_app=app_creator.main_app).update_settings()
+        django_installer.configure_main_app_routing()
+        settings.flush()
+        GunicornConfig(name).write()
+
+        # The manifest ProjectBuilder writes, for ProjectUpdater
+        created = app_creator.created_apps
+        options = {
+            "database": "sqlite",
+            "settings_profile": "development",
+            "worker_class": "gthread",
+            "cache_url": "locmem://",
+            "blueprints": str(blueprints) if blueprints else None,
+        }
+        files = generated_files(name, created, app_creator, template_creator, "gthread")
+        ProjectManifest.from_disk(chdir, name, created, options, files).write(chdir)
+        return chdir
+
+    return build
+
+
+def manage(project_dir, *args, env=None):
+    """Run manage.py in project_dir, failing the test with its output."""
+    result = subprocess.run(
+        [sys.executable, "manage.py", *args],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result.stdout
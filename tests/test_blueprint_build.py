@@ -0,0 +1,71 @@
+from conftest import manage
+
+CUSTOM_BLUEPRINTS = '''
+[default]
+model = "{App}Entry"
+str = "self.name"
+ordering = ["name"]
+list_display = ["name", "published_on"]
+search_fields = ["name"]
+list_filter = ["published_on"]
+
+[default.fields]
+name = "models.CharField(max_length=100)"
+published_on = "models.DateField()"
+'''
+
+
+def test_custom_default_blueprint_builds(build_project, tmp_path):
+    blueprints = tmp_path / "blueprints.toml"
+    blueprints.write_text(CUSTOM_BLUEPRINTS)
+    project_dir = build_project(apps=["notes"], blueprints=blueprints)
+
+    for app in ("home", "notes"):
+        admin = (project_dir / app / "admin.py").read_text()
+        assert f"class {app.capitalize()}EntryAdmin(ModelAdmin):" in admin
+        assert 'list_display = ("name", "published_on")' in admin
+        assert "show_full_result_count = False" in admin
+
+    # The admin checks run with makemigrations, where this used to fail
+    manage(project_dir, "makemigrations")
+    manage(project_dir, "check")
+
+
+RELATED_BLUEPRINTS = '''
+[tags]
+model = "Tag"
+str = "self.name"
+list_display = ["name"]
+
+[tags.fields]
+name = "models.CharField(max_length=50)"
+
+[notes]
+model = "Note"
+str = "self.title"
+list_display = ["title", "client"]
+search_fields = ["title"]
+
+[notes.relations]
+client = "clients.Client"
+tag = "tags.Tag"
+owner = "auth.User"
+
+[notes.fields]
+title = "models.CharField(max_length=100)"
+'''
+
+
+def test_autocompletes_only_for_searchable_admins(build_project, tmp_path):
+    blueprints = tmp_path / "blueprints.toml"
+    blueprints.write_text(RELATED_BLUEPRINTS)
+    project_dir = build_project(apps=["notes", "tags"], blueprints=blueprints)
+
+    admin = (project_dir / "notes" / "admin.py").read_text()
+    assert 'autocomplete_fields = ("client",)' in admin
+    # Tag's admin has no search_fields and User's admin isn't generated
+    assert 'raw_id_fields = ("tag", "owner")' in admin
+    assert 'list_select_related = ("client",)' in admin
+
+    manage(project_dir, "makemigrations")
+    manage(project_dir, "check")
@@ -0,0 +1,69 @@
+from importlib import metadata
+
+import pytest
+
+from django_starter.core import dependency_resolver
+from django_starter.core.dependency_resolver import DependencyResolver
+
+
+class Distribution:
+    def __init__(self, version, requires=None):
+        self.version = version
+        self.requires = requires
+
+
+INSTALLED = {
+    "django": Distribution("3.2.25"),
+    "whitenoise": Distribution("6.9.0", ["Brotli; extra == 'brotli'", "asgiref; python_version >= '3'"]),
+    "django-tailwind": Distribution("4.0.1", ["django-browser-reload>=1.12; extra == 'reload'"]),
+    "django-browser-reload": Distribution("1.6.0"),
+    "pick": Distribution("2.4.0rc1"),
+}
+
+
+@pytest.fixture(autouse=True)
+def installed(monkeypatch):
+    def distribution(name):
+        if name not in INSTALLED:
+            raise metadata.PackageNotFoundError(name)
+        return INSTALLED[name]
+
+    monkeypatch.setattr(dependency_resolver.metadata, "distribution", distribution)
+
+
+@pytest.mark.parametrize("requirement, satisfied", [
+    ("django", True),
+    ("django>=3.2,<4", True),
+    ("django>=5.0", False),
+    ("gunicorn", False),
+    ("gunicorn; python_version < '3'", True),
+    ("django>=5.0; python_version >= '3'", False),
+    ("pick>=2.4.0rc1", True),
+    ("pick>=2.3", True),
+])
+def test_versions_and_markers(requirement, satisfied):
+    assert DependencyResolver().is_satisfied(requirement) is satisfied
+
+
+def test_extras_need_their_own_dependencies():
+    resolver = DependencyResolver()
+    # Brotli only comes with the extra; asgiref isn't the extra's concern
+    assert resolver.is_satisfied("whitenoise")
+    assert not resolver.is_satisfied("whitenoise[brotli]")
+    # The extra's dependency is installed, but too old
+    assert not resolver.is_satisfied("django-tailwind[reload]")
+    INSTALLED["django-browser-reload"] = Distribution("1.12.1")
+    try:
+        assert resolver.is_satisfied("django-tailwind[reload]")
+    finally:
+        INSTALLED["django-browser-reload"] = Distribution("1.6.0")
+
+
+def test_install_skips_pip_only_when_everything_matches(monkeypatch):
+    commands = []
+    monkeypatch.setattr(dependency_resolver, "run_command", lambda args, **kwargs: commands.append(args))
+    DependencyResolver(["django>=3.2", "pick"]).install()
+    assert commands == []
+
+    DependencyResolver(["django>=5.0", "pick", "gunicorn"]).install()
+    assert commands[0][-2:] == ["django>=5.0", "gunicorn"]
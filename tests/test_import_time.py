@@ -0,0 +1,45 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# Total import time of `django-starter --help`; loading the installers and
+# their dependencies up front took about 150 ms
+BUDGET_MS = 100
+IMPORT_LINE_RE = re.compile(r"^import time:\s+(\d+) \|")
+
+# Prints the django_starter.core modules loaded by --help to stderr, after
+# the help text on stdout
+LOADED_MODULES_SCRIPT = """
+import sys
+from django_starter.__main__ import main
+
+try:
+    main(["--help"])
+except SystemExit:
+    pass
+print(*sorted(name for name in sys.modules if name.startswith("django_starter.core.")), file=sys.stderr)
+"""
+
+
+def python(*args):
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def test_help_stays_within_import_budget():
+    # The fastest of a few runs, so a busy machine doesn't fail the test
+    totals = []
+    for _ in range(3):
+        lines = python("-X", "importtime", "-m", "django_starter", "--help").stderr.splitlines()
+        matches = [IMPORT_LINE_RE.match(line) for line in lines]
+        totals.append(sum(int(match.group(1)) for match in matches if match) / 1000)
+    assert min(totals) < BUDGET_MS, f"--help spent {min(totals):.0f} ms importing"
+
+
+def test_help_does_not_import_installers():
+    loaded = python("-c", LOADED_MODULES_SCRIPT).stderr.split()
+    # Only the module holding the options' choices
+    assert loaded == ["django_starter.core.project_spec"]
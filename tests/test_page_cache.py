@@ -0,0 +1,70 @@
+from conftest import manage
+
+# Runs in the generated project with the page cache on
+CHECK_SCRIPT = """
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.test.utils import setup_test_environment
+from django.utils.cache import get_max_age
+
+from home.cache import cache_list_page, invalidate_list_pages, server_cache_page
+
+setup_test_environment()  # Allows the test server's host with DEBUG off
+renders = []
+
+def view(request):
+    renders.append(request.path)
+    return HttpResponse(str(len(renders)))
+
+request = RequestFactory().get("/")
+for decorated in (cache_list_page(view), server_cache_page(900)(view)):
+    renders.clear()
+    first = decorated(request)
+    second = decorated(request)
+    assert len(renders) == 1, renders  # Served from the server's cache
+    for response in (first, second):
+        assert get_max_age(response) == 0, response["Cache-Control"]
+        assert "private" in response["Cache-Control"], response["Cache-Control"]
+
+renders.clear()
+invalidate_list_pages()
+cached = cache_list_page(view)
+cached(request)
+cached(request)
+invalidate_list_pages()
+cached(request)
+cached(request)
+assert len(renders) == 2, renders  # Rendered again once after invalidating
+print("ok")
+"""
+
+
+def test_pages_are_cached_on_the_server_only(build_project):
+    project_dir = build_project()
+    env = {"CACHE_TTL": "900", "DJANGO_DEBUG": "0"}
+    assert manage(project_dir, "shell", "-c", CHECK_SCRIPT, env=env).splitlines()[-1] == "ok"
+
+
+BENCHMARK_SCRIPT = """
+from django.test.signals import template_rendered
+from django.test.utils import setup_test_environment
+
+from home.management.commands.benchmark_home import Command
+
+setup_test_environment()  # Sends template_rendered
+renders = []
+template_rendered.connect(lambda sender, template, **kwargs: renders.append(template.name), weak=False)
+Command().time_requests(2)
+print(renders.count("home/index.html"))
+"""
+
+
+def test_benchmark_times_uncached_pages(build_project):
+    project_dir = build_project()
+    # base.html comes with the Tailwind theme, which the fixture leaves out
+    (project_dir / "home" / "templates" / "base.html").write_text("{% block content %}{% endblock %}")
+    manage(project_dir, "makemigrations")
+    manage(project_dir, "migrate")
+    env = {"CACHE_TTL": "900", "DJANGO_DEBUG": "0"}
+    # The warm-up request and 5 rounds of 2, every one of them rendered
+    assert manage(project_dir, "shell", "-c", BENCHMARK_SCRIPT, env=env).splitlines()[-1] == "11"
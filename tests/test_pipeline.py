@@ -0,0 +1,144 @@
+import os
+import threading
+import time
+
+import pytest
+
+from django_starter.core.pipeline import Pipeline, step
+from django_starter.core.run_report import RunReport
+
+
+def test_step_records_resources():
+    @step(reads=["packages"], writes=["settings:apps"])
+    def create_apps():
+        pass
+
+    assert create_apps.reads == {"packages"}
+    assert create_apps.writes == {"settings:apps"}
+
+
+def test_dependencies_follow_conflicting_resources():
+    pipeline = Pipeline()
+    pipeline.add(lambda: None, "install", writes=["packages"])
+    pipeline.add(lambda: None, "theme", reads=["packages"], writes=["theme"])
+    pipeline.add(lambda: None, "settings", reads=["packages"], writes=["settings"])
+    pipeline.add(lambda: None, "templates", reads=["theme"], writes=["templates"])
+    pipeline.add(lambda: None, "routing", reads=["settings", "templates"])
+
+    names = {s.name: [dep.name for dep in deps] for s, deps in pipeline.dependencies().items()}
+    assert names == {
+        "install": [],
+        "theme": ["install"],
+        "settings": ["install"],
+        "templates": ["theme"],
+        "routing": ["settings", "templates"],
+    }
+
+
+def test_sequential_run_keeps_declaration_order():
+    calls = []
+    pipeline = Pipeline(jobs=1)
+    for name in ("a", "b", "c"):
+        pipeline.add(lambda name=name: calls.append(name), name)
+    pipeline.run()
+    assert calls == ["a", "b", "c"]
+
+
+def test_parallel_run_waits_for_dependencies():
+    calls = []
+    lock = threading.Lock()
+    both_started = threading.Barrier(2, timeout=5)
+
+    def independent(name):
+        def run():
+            # Fails with BrokenBarrierError unless both run at the same time
+            both_started.wait()
+            with lock:
+                calls.append(name)
+        return run
+
+    pipeline = Pipeline(jobs=2)
+    pipeline.add(independent("left"), "left", writes=["left"])
+    pipeline.add(independent("right"), "right", writes=["right"])
+    pipeline.add(lambda: calls.append("join"), "join", reads=["left", "right"])
+    pipeline.run()
+
+    assert sorted(calls[:2]) == ["left", "right"]
+    assert calls[2] == "join"
+
+
+def test_failure_skips_dependents_and_names_the_step():
+    calls = []
+
+    def fail():
+        raise ValueError("boom")
+
+    pipeline = Pipeline(jobs=2)
+    pipeline.add(fail, "install", writes=["packages"])
+    pipeline.add(lambda: calls.append("theme"), "theme", reads=["packages"])
+    with pytest.raises(Exception, match="install failed: boom"):
+        pipeline.run()
+    assert calls == []
+
+
+def test_steps_are_measured():
+    report = RunReport()
+    pipeline = Pipeline(jobs=2, report=report)
+    pipeline.add(lambda: None, "first", writes=["a"])
+    pipeline.add(lambda: None, "second", reads=["a"])
+    pipeline.run()
+    assert sorted(record["name"] for record in report.steps) == ["first", "second"]
+
+
+def build_settings(project_dir, jobs):
+    """Run the build's settings steps in project_dir and return the lines of settings.py."""
+    from django_starter.core.cache_installer import CacheInstaller
+    from django_starter.core.django_installer import DjangoInstaller
+    from django_starter.core.tailwind_installer import TailwindInstaller
+    from django_starter.core.unfold_installer import UnfoldInstaller
+    from django_starter.core.whitenoise_installer import WhiteNoiseInstaller
+    from django_starter.templates.app_template_creator import AppTemplateCreator
+
+    project_dir.mkdir()
+    os.chdir(project_dir)
+    django_installer = DjangoInstaller()
+    django_installer.get_project_name("acme")
+    django_installer.create_django_project(project_dir, timezone="UTC")
+    settings = django_installer.settings
+    tailwind = TailwindInstaller("acme", settings=settings)
+    app_creator = AppTemplateCreator("acme", settings=settings)
+    app_creator.set_additional_apps([])
+    django_installer.apps = app_creator.created_apps
+    steps = [
+        tailwind.update_initial_settings,
+        tailwind.update_final_settings,
+        app_creator.create_apps,
+        UnfoldInstaller("acme", settings=settings).update_settings,
+        WhiteNoiseInstaller(settings).update_settings,
+        CacheInstaller("acme", settings, main_app=app_creator.main_app).update_settings,
+        django_installer.configure_main_app_routing,
+    ]
+
+    def slowed(func, seconds):
+        def run():
+            time.sleep(seconds)
+            func()
+        return run
+
+    # Earlier steps sleep longer, so without their dependencies later ones
+    # would finish first
+    pipeline = Pipeline(jobs=jobs)
+    for i, func in enumerate(steps):
+        pipeline.add(slowed(func, 0.05 * (len(steps) - i)), func.__qualname__, func.reads, func.writes)
+    pipeline.run()
+    settings.flush()
+    lines = (project_dir / "acme" / "settings.py").read_text().splitlines()
+    # Every project gets its own secret key
+    return [line for line in lines if not line.startswith("SECRET_KEY")]
+
+
+def test_parallel_build_writes_the_same_settings(tmp_path, chdir):
+    pytest.importorskip("django")
+    sequential = build_settings(tmp_path / "sequential", jobs=1)
+    parallel = build_settings(tmp_path / "parallel", jobs=4)
+    assert parallel == sequential
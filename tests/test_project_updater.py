@@ -0,0 +1,179 @@
+import json
+
+import pytest
+
+from django_starter.core.project_updater import (
+    MANIFEST_NAME,
+    ProjectManifest,
+    ProjectUpdater,
+    locate_project,
+)
+
+
+@pytest.fixture
+def rebuilds(monkeypatch):
+    """Record the paths each rebuild got instead of running Tailwind and manage.py."""
+    calls = []
+    monkeypatch.setattr(
+        ProjectUpdater, "_rebuild",
+        lambda self, manifest, settings, apps, written: calls.append(sorted(written)),
+    )
+    return calls
+
+
+def set_option(project_dir, name, value):
+    path = project_dir / MANIFEST_NAME
+    data = json.loads(path.read_text())
+    data["options"][name] = value
+    path.write_text(json.dumps(data))
+
+
+def snapshot(project_dir):
+    return {
+        path: path.read_bytes()
+        for path in project_dir.rglob("*")
+        if path.is_file() and "__pycache__" not in path.parts and path.name != MANIFEST_NAME
+    }
+
+
+def test_update_of_a_fresh_project_changes_nothing(build_project, rebuilds):
+    project_dir = build_project()
+    before = snapshot(project_dir)
+    assert ProjectUpdater(project_dir).update() == []
+    assert snapshot(project_dir) == before
+    assert rebuilds == [[]]
+
+
+def test_changed_output_rewrites_untouched_files(build_project, rebuilds):
+    project_dir = build_project()
+    set_option(project_dir, "worker_class", "sync")
+    ProjectUpdater(project_dir).update()
+    assert '"GUNICORN_WORKER_CLASS", "sync"' in (project_dir / "gunicorn.conf.py").read_text()
+    assert rebuilds == [["gunicorn.conf.py"]]
+
+    manifest = ProjectManifest.load(project_dir)
+    assert manifest.options["worker_class"] == "sync"
+    # Recorded as generated, so later updates may rewrite it again
+    set_option(project_dir, "worker_class", "gthread")
+    ProjectUpdater(project_dir).update()
+    assert '"GUNICORN_WORKER_CLASS", "gthread"' in (project_dir / "gunicorn.conf.py").read_text()
+
+
+def test_local_edits_are_kept(build_project, rebuilds, capsys):
+    project_dir = build_project()
+    config = project_dir / "gunicorn.conf.py"
+    config.write_text(config.read_text() + "timeout = 120\n")
+    edited = config.read_text()
+
+    # Nothing new to bring in: the edit is kept without a warning
+    ProjectUpdater(project_dir).update()
+    assert config.read_text() == edited
+    assert "Keeping local edits" not in capsys.readouterr().out
+
+    set_option(project_dir, "worker_class", "sync")
+    ProjectUpdater(project_dir).update()
+    assert config.read_text() == edited
+    assert "Keeping local edits to gunicorn.conf.py" in capsys.readouterr().out
+    assert rebuilds[-1] == []
+
+
+def test_update_adds_apps_from_the_spec(build_project, rebuilds):
+    from django_starter.core.project_spec import ProjectSpec
+
+    project_dir = build_project()
+    spec = ProjectSpec("acme", apps=["notes"])
+    assert ProjectUpdater(project_dir, spec=spec).update() == ["notes"]
+
+    assert (project_dir / "notes" / "models.py").exists()
+    assert "'notes'," in (project_dir / "acme" / "settings.py").read_text()
+    assert 'include("notes.urls", namespace="notes")' in (project_dir / "acme" / "urls.py").read_text()
+    assert ProjectManifest.load(project_dir).apps[-1] == "notes"
+    assert "notes/models.py" in rebuilds[0]
+
+
+def test_projects_without_a_manifest_are_refused(tmp_path):
+    with pytest.raises(Exception, match=MANIFEST_NAME):
+        ProjectUpdater(tmp_path).update()
+
+
+def test_locate_project(tmp_path, chdir):
+    projects = tmp_path / "django_projects"
+    for name in ("acme", "other"):
+        (projects / name).mkdir(parents=True)
+        (projects / name / MANIFEST_NAME).write_text("{}")
+
+    assert locate_project(projects, "acme") == projects / "acme"
+    with pytest.raises(Exception, match="No project named missing"):
+        locate_project(projects, "missing")
+    with pytest.raises(Exception, match="acme, other"):
+        locate_project(projects)
+
+    (projects / "other" / MANIFEST_NAME).unlink()
+    assert locate_project(projects) == projects / "acme"
+
+
+def test_add_apps_patches_settings_and_urls_in_place(build_project, rebuilds):
+    from conftest import manage
+
+    project_dir = build_project()
+    settings = project_dir / "acme" / "settings.py"
+    urls = project_dir / "acme" / "urls.py"
+    settings.write_text(settings.read_text().replace(
+        "    'orders',\n", "    'orders',  # orders, by hand\n    'django.contrib.humanize'\n"
+    ))
+    urls.write_text(urls.read_text().replace(
+        "urlpatterns = [\n", 'urlpatterns = [\n    path("healthz/", include("home.urls")),  # custom\n'
+    ))
+    settings_before = settings.read_text()
+    urls_before = urls.read_text()
+    before = snapshot(project_dir)
+
+    assert ProjectUpdater(project_dir).add_apps(["notes", "inventory"]) == ["notes", "inventory"]
+
+    assert settings.read_text() == settings_before.replace(
+        "    'django.contrib.humanize'\n",
+        "    'django.contrib.humanize',\n    'notes',\n    'inventory',\n",
+    )
+    assert urls.read_text() == urls_before.replace("]\n", (
+        '    path("notes/", include("notes.urls", namespace="notes")),\n'
+        '    path("inventory/", include("inventory.urls", namespace="inventory")),\n'
+        "]\n"
+    ), 1)
+    changed = {path for path, data in snapshot(project_dir).items() if before.get(path) != data}
+    assert {path.relative_to(project_dir).parts[0] for path in changed} == {"acme", "notes", "inventory"}
+    assert {path.split("/")[0] for path in rebuilds[0]} == {"notes", "inventory"}
+    manage(project_dir, "check")
+
+    with pytest.raises(Exception, match="App notes already exists"):
+        ProjectUpdater(project_dir).add_apps(["notes"])
+
+
+def test_squash_migrations_made_by_updates(build_project):
+    from conftest import manage
+
+    project_dir = build_project()
+    manifest = ProjectManifest.load(project_dir)
+    updater = ProjectUpdater(project_dir, squash_migrations=True)
+    models = project_dir / "orders" / "models.py"
+    migrations = project_dir / "orders" / "migrations"
+
+    def add_field(name):
+        models.write_text(models.read_text().replace(
+            "class Order(models.Model):\n",
+            f"class Order(models.Model):\n    {name} = models.TextField(blank=True)\n",
+        ))
+        updater._rebuild(manifest, None, manifest.apps, ["orders/models.py"])
+        return sorted(path.stem for path in migrations.glob("*_squashed_*.py"))
+
+    # The initial migration alone has nothing to be squashed with
+    updater._rebuild(manifest, None, manifest.apps, ["orders/models.py"])
+    assert [path.name for path in migrations.glob("0*.py")] == ["0001_initial.py"]
+
+    assert add_field("notes") == ["0001_initial_squashed_0002_order_notes"]
+    # A single migration since the last squash is left alone
+    assert add_field("reference") == ["0001_initial_squashed_0002_order_notes"]
+    assert add_field("priority") == [
+        "0001_initial_squashed_0002_order_notes",
+        "0003_order_reference_squashed_0004_order_priority",
+    ]
+    manage(project_dir, "migrate", "--check")
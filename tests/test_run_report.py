@@ -0,0 +1,69 @@
+import sys
+import threading
+import time
+
+from django_starter.core.run_report import RunReport, run_command, write_project_file
+from django_starter.utils.project_files import ProjectFiles
+
+# Longer than the filesystem's timestamp granularity, so mtimes fall inside
+# the command that wrote the file
+TICK = 0.05
+
+WRITE_SCRIPT = """
+import sys, time
+time.sleep({tick})
+open(sys.argv[1], "wb").write(b"x" * int(sys.argv[2]))
+time.sleep({tick})
+""".format(tick=TICK)
+
+
+def write_in_subprocess(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    run_command([sys.executable, "-c", WRITE_SCRIPT, str(path), str(size)], check=True)
+
+
+def bytes_written(report):
+    return {record["name"]: record["bytes_written"] for record in report.to_dict()["steps"]}
+
+
+def test_overlapping_steps_are_charged_their_own_writes(tmp_path):
+    report = RunReport(root=tmp_path)
+    both_started = threading.Barrier(2, timeout=5)
+
+    def templates():
+        with report.measure("templates"):
+            both_started.wait()
+            files = ProjectFiles(tmp_path)
+            files.stage("templates/base.html", "x" * 100)
+            files.stage("templates/home.html", "x" * 20)
+            files.commit()
+
+    def gunicorn():
+        with report.measure("gunicorn"):
+            both_started.wait()
+            write_project_file(tmp_path / "gunicorn.conf.py", "x" * 7)
+
+    threads = [threading.Thread(target=templates), threading.Thread(target=gunicorn)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert bytes_written(report) == {"templates": 120, "gunicorn": 7}
+
+
+def test_subprocess_writes_are_found_outside_dependencies(tmp_path):
+    (tmp_path / "old.txt").write_bytes(b"x" * 1000)
+    time.sleep(TICK)
+    report = RunReport(root=tmp_path)
+    with report.measure("tailwind"):
+        write_project_file(tmp_path / "tailwind.config.js", "x" * 3)
+        write_in_subprocess(tmp_path / "package-lock.json", 10)
+        write_in_subprocess(tmp_path / "node_modules" / "tailwindcss" / "index.js", 1000)
+    with report.measure("collectstatic"):
+        write_in_subprocess(tmp_path / "staticfiles" / "styles.css", 1000)
+        write_in_subprocess(tmp_path / "db.sqlite3", 200)
+
+    assert bytes_written(report) == {"tailwind": 13, "collectstatic": 200}
+    # Rendering again neither walks again nor counts twice
+    assert bytes_written(report) == {"tailwind": 13, "collectstatic": 200}
@@ -0,0 +1,134 @@
+import threading
+
+import pytest
+
+from django_starter.utils.settings_document import SettingsDocument
+
+SETTINGS = """from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+DEBUG = True
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.staticfiles',
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+ROOT_URLCONF = 'acme.urls'
+
+# Internationalization
+
+STATIC_URL = 'static/'
+"""
+
+
+@pytest.fixture
+def settings_path(tmp_path):
+    path = tmp_path / "settings.py"
+    path.write_text(SETTINGS)
+    return path
+
+
+def namespace(path):
+    values = {"__file__": str(path)}
+    exec(path.read_text(), values)
+    return values
+
+
+def test_nothing_is_written_before_flush(settings_path):
+    settings = SettingsDocument(settings_path)
+    settings.add_installed_apps(["home"])
+    settings.set("DEBUG", "False")
+    assert settings_path.read_text() == SETTINGS
+
+
+def test_installed_apps_at_either_end_without_duplicates(settings_path):
+    settings = SettingsDocument(settings_path)
+    settings.add_installed_apps(["home", "django.contrib.admin"])
+    settings.add_installed_apps(["unfold"], first=True)
+    settings.add_installed_apps(["home"])
+    settings.flush()
+    assert namespace(settings_path)["INSTALLED_APPS"] == [
+        "unfold", "django.contrib.admin", "django.contrib.staticfiles", "home",
+    ]
+
+
+def test_middleware_after_another(settings_path):
+    settings = SettingsDocument(settings_path)
+    settings.add_middleware(
+        ["whitenoise.middleware.WhiteNoiseMiddleware"],
+        after="django.middleware.security.SecurityMiddleware",
+    )
+    settings.add_middleware(["missing.After"], after="not.Listed")
+    settings.flush()
+    # Without the `after` middleware, `first` decides, here the end
+    assert namespace(settings_path)["MIDDLEWARE"] == [
+        "django.middleware.security.SecurityMiddleware",
+        "whitenoise.middleware.WhiteNoiseMiddleware",
+        "django.middleware.common.CommonMiddleware",
+        "missing.After",
+    ]
+
+
+def test_set_replaces_or_adds_settings(settings_path):
+    settings = SettingsDocument(settings_path)
+    settings.set("DEBUG", "False")
+    settings.set("HOME_APP", "'home'", after="ROOT_URLCONF")
+    settings.set("TIME_ZONE", "'UTC'")
+    settings.flush()
+
+    lines = settings_path.read_text().splitlines()
+    assert lines.count("DEBUG = False") == 1 and "DEBUG = True" not in lines
+    assert lines[lines.index("ROOT_URLCONF = 'acme.urls'") + 1] == "HOME_APP = 'home'"
+    assert lines[-1] == "TIME_ZONE = 'UTC'"
+
+
+def test_imports_and_appended_lines(settings_path):
+    settings = SettingsDocument(settings_path)
+    settings.ensure_import("import os")
+    settings.ensure_import("import os")
+    settings.ensure_import("from pathlib import Path")
+    settings.append(["\nCACHE_TTL = 0\n"])
+    settings.flush()
+    content = settings_path.read_text()
+    assert content.startswith("import os\nfrom pathlib import Path\n")
+    assert content.count("import os\n") == 1
+    assert content.count("from pathlib import Path\n") == 1
+    assert namespace(settings_path)["CACHE_TTL"] == 0
+
+
+def test_edits_after_a_flush_use_the_new_content(settings_path):
+    settings = SettingsDocument(settings_path)
+    settings.add_installed_apps(["home"])
+    settings.flush()
+    settings.add_installed_apps(["clients"])
+    settings.set("HOME_APP", "'home'", after="ROOT_URLCONF")
+    settings.flush()
+    values = namespace(settings_path)
+    assert values["INSTALLED_APPS"][-2:] == ["home", "clients"]
+    assert values["HOME_APP"] == "home"
+
+
+def test_missing_anchor_raises(tmp_path):
+    path = tmp_path / "settings.py"
+    path.write_text("DEBUG = True\n")
+    with pytest.raises(Exception, match="INSTALLED_APPS"):
+        SettingsDocument(path).add_installed_apps(["home"])
+
+
+def test_concurrent_edits_are_all_applied(settings_path):
+    settings = SettingsDocument(settings_path)
+    apps = [f"app{i}" for i in range(50)]
+    threads = [threading.Thread(target=settings.add_installed_apps, args=([app],)) for app in apps]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    settings.flush()
+    assert set(apps) <= set(namespace(settings_path)["INSTALLED_APPS"])
@@ -0,0 +1,75 @@
+import pytest
+
+from django_starter.core import skeleton_cache
+from django_starter.core.skeleton_cache import SkeletonCache
+
+
+@pytest.fixture
+def project(tmp_path):
+    static_src = tmp_path / "project" / "theme" / "static_src"
+    (static_src / "node_modules" / "tailwindcss").mkdir(parents=True)
+    (static_src / "node_modules" / "tailwindcss" / "index.js").write_text("// tailwind")
+    (static_src / "package.json").write_text("{}")
+    (static_src / "package-lock.json").write_text("{}")
+    return tmp_path / "project"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SkeletonCache(tmp_path / "cache")
+    # Skip the package and node lookups
+    cache._versions = {"django-starter": "test"}
+    return cache
+
+
+def fail_on(monkeypatch, name):
+    """Make copy_tree fail once it has copied part of the tree below `name`."""
+    copy_tree = skeleton_cache.copy_tree
+
+    def failing_copy_tree(src, dst, **kwargs):
+        copy_tree(src, dst, **kwargs)
+        if name in str(src):
+            raise OSError("No space left on device")
+
+    monkeypatch.setattr(skeleton_cache, "copy_tree", failing_copy_tree)
+
+
+def test_store_publishes_the_staged_theme(project, cache):
+    cache.capture_theme(project)
+    cache.store_theme(project)
+    assert cache.has_theme()
+    assert (cache.entry / "theme" / "static_src" / "node_modules" / "tailwindcss" / "index.js").exists()
+    assert [path.name for path in cache.cache_dir.iterdir()] == [cache.key]
+
+
+def test_failed_capture_leaves_nothing_behind(project, cache, monkeypatch):
+    fail_on(monkeypatch, "theme")
+    with pytest.raises(OSError):
+        cache.capture_theme(project)
+    assert list(cache.cache_dir.iterdir()) == []
+    cache.store_theme(project)
+    assert not cache.has_theme()
+
+
+def test_failed_store_leaves_nothing_behind(project, cache, monkeypatch):
+    cache.capture_theme(project)
+    fail_on(monkeypatch, "node_modules")
+    with pytest.raises(OSError):
+        cache.store_theme(project)
+    assert list(cache.cache_dir.iterdir()) == []
+
+
+def test_discard_drops_the_staged_theme(project, cache):
+    cache.capture_theme(project)
+    cache.discard_theme()
+    assert list(cache.cache_dir.iterdir()) == []
+    cache.store_theme(project)
+    assert not cache.has_theme()
+
+
+def test_a_theme_published_meanwhile_wins(project, cache):
+    (cache.entry / "theme").mkdir(parents=True)
+    (cache.entry / "versions.json").write_text("{}")
+    cache.capture_theme(project)
+    cache.store_theme(project)
+    assert sorted(path.name for path in cache.cache_dir.iterdir()) == [cache.key]
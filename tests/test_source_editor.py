@@ -0,0 +1,66 @@
+import pytest
+
+from django_starter.utils.source_editor import SourceEditor
+
+
+def edit(tmp_path, source, name="X", strings=("b", "new")):
+    path = tmp_path / "module.py"
+    path.write_text(source)
+    editor = SourceEditor(path)
+    editor.add_strings(name, list(strings))
+    editor.flush()
+    return path.read_text()
+
+
+@pytest.mark.parametrize("source, expected", [
+    (
+        "X = [\n    'a',\n    'b'  # note, here\n]\nY = 1\n",
+        "X = [\n    'a',\n    'b',  # note, here\n    'new',\n]\nY = 1\n",
+    ),
+    ("X = ['a', 'b']\n", "X = ['a', 'b', 'new']\n"),
+    ('X = ["a"]\n', 'X = ["a", "b", "new"]\n'),
+    ("X = []\n", "X = ['b', 'new']\n"),
+    ("X = [\n]\n", "X = [\n    'b',\n    'new',\n]\n"),
+    ('X: list = [\n    "a",\n    "b"]\n', 'X: list = [\n    "a",\n    "b", "new"]\n'),
+    ("# é\nX = [\n    'é',\n]\n", "# é\nX = [\n    'é',\n    'b',\n    'new',\n]\n"),
+])
+def test_add_strings_keeps_the_surrounding_source(tmp_path, source, expected):
+    assert edit(tmp_path, source) == expected
+
+
+def test_expressions_equal_to_existing_ones_are_skipped(tmp_path):
+    path = tmp_path / "urls.py"
+    path.write_text(
+        "urlpatterns = [\n"
+        "    path('admin/', admin.site.urls),\n"
+        "    path(\"healthz/\", health),  # added by hand\n"
+        "]\n"
+    )
+    editor = SourceEditor(path)
+    editor.add_to_list("urlpatterns", [
+        'path("admin/", admin.site.urls)',
+        'path("notes/", include("notes.urls", namespace="notes"))',
+    ])
+    assert editor.list_elements("urlpatterns") == [
+        "path('admin/', admin.site.urls)",
+        'path("healthz/", health)',
+        'path("notes/", include("notes.urls", namespace="notes"))',
+    ]
+    assert "# added by hand" in editor.render()
+
+
+def test_nothing_is_written_without_changes(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text("X = ['a']\n")
+    mtime = path.stat().st_mtime_ns
+    editor = SourceEditor(path)
+    editor.add_strings("X", ["a"])
+    editor.flush()
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_only_module_level_list_literals_are_edited(tmp_path):
+    with pytest.raises(Exception, match="not a list literal"):
+        edit(tmp_path, "X = ('a',)\n")
+    with pytest.raises(Exception, match=r"Could not find X = \[...\]"):
+        edit(tmp_path, "def f():\n    X = []\n")
@@ -0,0 +1,81 @@
+from django_starter.core.tailwind_installer import TailwindInstaller
+
+CONFIG_V3 = """module.exports = {
+    content: [
+        /* Templates within theme app */
+        '../templates/**/*.html',
+        '../../**/templates/**/*.html',
+    ],
+    theme: {
+        extend: {},
+    },
+}
+"""
+
+STYLES_V4 = """@import "tailwindcss";
+
+/**
+  * A catch-all path to Django template files.
+  */
+@source "../../../**/*.{html,py,js}";
+@source "../../../extra";
+"""
+
+
+def theme(tmp_path, files):
+    static_src = tmp_path / "theme" / "static_src"
+    for name, content in files.items():
+        (static_src / name).parent.mkdir(parents=True, exist_ok=True)
+        (static_src / name).write_text(content)
+    return static_src
+
+
+def installer():
+    tailwind = TailwindInstaller("acme", settings=object())
+    tailwind.apps = ["home", "billing"]
+    return tailwind
+
+
+def test_tailwind_3_content_list(tmp_path, chdir):
+    static_src = theme(tmp_path, {"tailwind.config.js": CONFIG_V3})
+    installer().write_content_config()
+
+    config = (static_src / "tailwind.config.js").read_text()
+    assert "'../../**/templates/**/*.html'" not in config
+    for glob in ("../templates", "../../templates", "../../home/templates", "../../billing/templates"):
+        assert f"        '{glob}/**/*.html',\n" in config
+    assert config.endswith("    ],\n    theme: {\n        extend: {},\n    },\n}\n")
+
+
+def test_tailwind_4_source_rules(tmp_path, chdir):
+    static_src = theme(tmp_path, {"src/styles.css": STYLES_V4})
+    tailwind = installer()
+    tailwind.write_content_config()
+    styles = (static_src / "src" / "styles.css").read_text()
+
+    assert styles.startswith('@import "tailwindcss" source(none);\n')
+    assert [line for line in styles.splitlines() if line.startswith("@source")] == [
+        '@source "../../templates/**/*.html";',
+        '@source "../../../templates/**/*.html";',
+        '@source "../../../home/templates/**/*.html";',
+        '@source "../../../billing/templates/**/*.html";',
+    ]
+    # Running again, e.g. from an update, gives the same file
+    tailwind.write_content_config()
+    assert (static_src / "src" / "styles.css").read_text() == styles
+
+
+def test_tailwind_4_without_source_rules(tmp_path, chdir):
+    static_src = theme(tmp_path, {"src/styles.css": '@import "tailwindcss";\n\n.btn { color: red; }\n'})
+    installer().write_content_config()
+    styles = (static_src / "src" / "styles.css").read_text()
+    assert styles.startswith('@import "tailwindcss" source(none);\n/* Templates')
+    assert '@source "../../../billing/templates/**/*.html";\n\n.btn' in styles
+
+
+def test_unknown_layouts_are_left_alone(tmp_path, chdir, capsys):
+    config = "module.exports = require('./shared.config.js')\n"
+    static_src = theme(tmp_path, {"tailwind.config.js": config})
+    installer().write_content_config()
+    assert (static_src / "tailwind.config.js").read_text() == config
+    assert "Warning: no content list or @source rules found" in capsys.readouterr().out